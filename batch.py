@@ -0,0 +1,183 @@
+from concurrent.futures import (ProcessPoolExecutor, as_completed)
+from graph import Graph
+from graph_file import (is_binary_graph_file, open_binary_graph, read_edge_list, read_graph, write_binary_graph,
+                        write_edge_list, write_list2)
+import argparse
+import numpy_backend
+import os
+import sys
+
+__operations_names__ = ['set_state', 'addition', 'union', 'connection', 'intersection', 'symmetric_difference', 'identify',
+                        'remove_vertex', 'remove_edge']
+
+
+def parse_operation(text: str) -> tuple:
+    name, _, arguments = text.partition(':')
+    if name not in __operations_names__:
+        raise argparse.ArgumentTypeError(f"unknown operation '{name}'")
+    arguments = arguments.split(',') if arguments else []
+    expected_arguments_number = {
+        'set_state': 1,
+        'addition': 0,
+        'union': 1,
+        'connection': 1,
+        'intersection': 1,
+        'symmetric_difference': 1,
+        'identify': 2,
+        'remove_vertex': 1,
+        'remove_edge': 2
+    }[name]
+    if len(arguments) != expected_arguments_number:
+        raise argparse.ArgumentTypeError(f"operation '{name}' takes {expected_arguments_number} arguments")
+    if name == 'set_state':
+        if arguments[0].upper() not in Graph.State.__members__:
+            raise argparse.ArgumentTypeError(f"unknown state '{arguments[0]}'")
+        return name, Graph.State[arguments[0].upper()]
+    if name in ['identify', 'remove_vertex', 'remove_edge']:
+        try:
+            return (name, *[int(argument) - 1 for argument in arguments])
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"operation '{name}' takes vertex numbers")
+    return name, *arguments
+
+
+def parse_state(text: str) -> Graph.State:
+    if text.upper() not in Graph.State.__members__:
+        raise argparse.ArgumentTypeError(f"unknown state '{text}'")
+    return Graph.State[text.upper()]
+
+
+def load_graph(filename: str, state: Graph.State, edge_list: bool) -> Graph:
+    if is_binary_graph_file(filename):
+        return open_binary_graph(filename)
+    if edge_list:
+        return read_edge_list(filename, state, filename)
+    return read_graph(filename, state, filename)
+
+
+def check_vertex(graph: Graph, v: int) -> None:
+    if v not in range(len(graph.vertices())):
+        raise ValueError(f"graph '{graph.name}' has no vertex v_{v + 1}")
+
+
+def apply_operation(graph: Graph, operation: tuple, state: Graph.State, edge_list: bool, operands: dict) -> Graph:
+    name, *arguments = operation
+    if name == 'set_state':
+        graph.set_state(*arguments)
+    elif name == 'addition':
+        graph = Graph.addition(graph)
+    elif name in ['union', 'connection', 'intersection', 'symmetric_difference']:
+        if arguments[0] not in operands:
+            operands[arguments[0]] = load_graph(arguments[0], state, edge_list)
+        graph = getattr(graph, name)(operands[arguments[0]])
+    else:
+        graph = graph.materialize()
+        for v in arguments:
+            check_vertex(graph, v)
+        if name == 'identify':
+            graph.identify_vertices(*arguments)
+        elif name == 'remove_vertex':
+            graph.remove_vertex(*arguments)
+        else:
+            graph.remove_directed_edge(tuple(arguments))
+    return graph
+
+
+def output_filename(filename: str, output_directory: str, output_format: str) -> str:
+    stem = os.path.splitext(os.path.basename(filename[:-3] if filename.endswith('.gz') else filename))[0]
+    return os.path.join(output_directory, stem + {'text': '.txt', 'binary': '.bin', 'edge_list': '.edges'}[output_format])
+
+
+def process_file(filename: str, state: Graph.State, edge_list: bool, operations: list, output_directory: str,
+                 output_format: str) -> str:
+    source, operands = load_graph(filename, state, edge_list), {}
+    graph = source
+    try:
+        for operation in operations:
+            graph = apply_operation(graph, operation, state, edge_list, operands)
+        graph = graph.materialize()
+        result_filename = output_filename(filename, output_directory, output_format)
+        if output_format == 'binary':
+            write_binary_graph(result_filename, graph)
+        elif output_format == 'edge_list':
+            write_edge_list(result_filename, graph)
+        else:
+            write_list2(result_filename, graph.list2)
+        return result_filename
+    finally:
+        for loaded_graph in [source, *operands.values()]:
+            loaded_graph.close()
+
+
+def initialize_worker(use_numpy: bool) -> None:
+    if use_numpy:
+        numpy_backend.enable()
+    else:
+        numpy_backend.disable()
+
+
+def run(filenames: list, state: Graph.State, edge_list: bool, operations: list, output_directory: str,
+        output_format: str, jobs_number: int, output) -> int:
+    os.makedirs(output_directory, exist_ok=True)
+    inputs_by_output = {}
+    for filename in filenames:
+        inputs_by_output.setdefault(output_filename(filename, output_directory, output_format), []).append(filename)
+    failures_number = 0
+    for result_filename, inputs in inputs_by_output.items():
+        if len(inputs) > 1:
+            for filename in inputs:
+                output.write(f"{filename}: error: '{result_filename}' is also the output of another input\n")
+            failures_number += len(inputs)
+    filenames = [filename for filename in filenames
+                 if len(inputs_by_output[output_filename(filename, output_directory, output_format)]) == 1]
+    if jobs_number == 1:
+        for filename in filenames:
+            try:
+                result_filename = process_file(filename, state, edge_list, operations, output_directory, output_format)
+                output.write(f'{filename} -> {result_filename}\n')
+            except Exception as error:
+                output.write(f'{filename}: error: {error}\n')
+                failures_number += 1
+        return failures_number
+    with ProcessPoolExecutor(jobs_number, initializer=initialize_worker,
+                             initargs=(numpy_backend.is_enabled(),)) as executor:
+        futures = {executor.submit(process_file, filename, state, edge_list, operations, output_directory,
+                                   output_format): filename
+                   for filename in filenames}
+        for future in as_completed(futures):
+            try:
+                output.write(f'{futures[future]} -> {future.result()}\n')
+            except Exception as error:
+                output.write(f'{futures[future]}: error: {error}\n')
+                failures_number += 1
+    return failures_number
+
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description='Apply graph operations to many graph files without prompts')
+    parser.add_argument('inputs', nargs='+', help='graph files, text or binary')
+    parser.add_argument('--input-state', type=parse_state, default=Graph.State.ADJACENCY_MATRIX,
+                        help='state of text input files: ' + ', '.join(state.name.lower() for state in Graph.State))
+    parser.add_argument('--edge-list-input', action='store_true',
+                        help="read text input files as 'u v' edge lists, optionally gzip-compressed")
+    parser.add_argument('--operation', '-o', type=parse_operation, action='append', default=[], dest='operations',
+                        help='set_state:STATE, addition, union:FILE, connection:FILE, intersection:FILE, '
+                             'symmetric_difference:FILE, identify:I,J, '
+                             'remove_vertex:V or remove_edge:U,V; vertices are numbered from 1')
+    parser.add_argument('--output-directory', '-d', required=True)
+    output_formats = parser.add_mutually_exclusive_group()
+    output_formats.add_argument('--binary', action='store_true', help='write binary graph files instead of text')
+    output_formats.add_argument('--edge-list', action='store_true', help="write 'u v' edge lists instead of text")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='number of files processed concurrently')
+    parser.add_argument('--no-numpy', action='store_true')
+    arguments = parser.parse_args(arguments)
+    if not arguments.no_numpy:
+        numpy_backend.enable()
+    jobs_number = arguments.jobs if arguments.jobs > 0 else os.cpu_count() or 1
+    output_format = 'binary' if arguments.binary else 'edge_list' if arguments.edge_list else 'text'
+    return int(run(arguments.inputs, arguments.input_state, arguments.edge_list_input, arguments.operations,
+                   arguments.output_directory, output_format, jobs_number, sys.stdout) != 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+from graph import Graph
+import argparse
+import copy
+import json
+import numpy_backend
+import parallel
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def random_adjacency_matrix(n: int, density: float, rnd: random.Random) -> list:
+    result = [[0] * n for _ in range(n)]
+    for u in range(n):
+        if rnd.random() < density:
+            result[u][u] = rnd.randint(1, 2)
+        for v in range(u + 1, n):
+            if rnd.random() < density:
+                kind = rnd.randrange(3)
+                result[u][v] = int(kind != 1)
+                result[v][u] = int(kind != 0)
+    return result
+
+
+def random_graph(n: int, density: float, seed: int) -> Graph:
+    return Graph(random_adjacency_matrix(n, density, random.Random(seed)), Graph.State.ADJACENCY_MATRIX, f'g_{n}_{density}')
+
+
+def graph_in_state(list2_by_state: dict, state: Graph.State) -> Graph:
+    graph = Graph(copy.deepcopy(list2_by_state[state]), state)
+    graph.list2
+    return graph
+
+
+def measure(setup, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        function = setup()
+        begin = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    function = setup()
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times), 'median_seconds': statistics.median(times), 'peak_bytes': peak}
+
+
+def conversion_cases(list2_by_state: dict):
+    for old_state in Graph.State:
+        for new_state in Graph.State:
+            if old_state != new_state:
+                def setup(old_state=old_state, new_state=new_state):
+                    graph = graph_in_state(list2_by_state, old_state)
+                    return lambda: (graph.set_state(new_state), graph.list2)
+                yield f'set_state:{old_state.name.lower()}->{new_state.name.lower()}', old_state, setup
+
+
+def operation_cases(list2_by_state: dict, rnd: random.Random):
+    n = len(list2_by_state[Graph.State.ADJACENCY_MATRIX])
+    edges = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(max(1, n))]
+    operations = {
+        'addition': lambda graph, other: Graph.addition(graph).materialize().list2,
+        'union': lambda graph, other: graph.union(other).materialize().list2,
+        'connection': lambda graph, other: graph.connection(other).materialize().list2,
+        'intersection': lambda graph, other: graph.intersection(other).materialize().list2,
+        'symmetric_difference': lambda graph, other: graph.symmetric_difference(other).materialize().list2,
+        'lazy_union_degree_sequence': lambda graph, other: graph.union(other).degree_sequence(),
+        'lazy_connection_edges_number': lambda graph, other: graph.connection(other).edges_number(),
+        'lazy_addition_degree_sequence': lambda graph, other: Graph.addition(graph).degree_sequence(),
+        'addition_of_union': lambda graph, other: Graph.addition(graph.union(other)).materialize().list2,
+        'identify_vertices': lambda graph, other: (graph.identify_vertices(0, n - 1), graph.list2),
+        'add_vertex': lambda graph, other: (graph.add_vertex(n // 2), graph.list2),
+        'remove_vertex': lambda graph, other: (graph.remove_vertex(n // 2), graph.list2),
+        'add_directed_edge': lambda graph, other: (graph.add_directed_edge(edges[0]), graph.list2),
+        'remove_directed_edge': lambda graph, other: (graph.remove_directed_edge(edges[0]), graph.list2),
+        'add_directed_edges': lambda graph, other: (graph.add_directed_edges(edges), graph.list2),
+        'remove_directed_edges': lambda graph, other: (graph.remove_directed_edges(edges), graph.list2),
+        'edges_number': lambda graph, other: graph.edges_number(),
+        'directed_edges': lambda graph, other: graph.directed_edges()
+    }
+    for state in Graph.State:
+        for name, operation in operations.items():
+            def setup(state=state, operation=operation):
+                graph, other = graph_in_state(list2_by_state, state), graph_in_state(list2_by_state, state)
+                return lambda: operation(graph, other)
+            yield name, state, setup
+
+
+def run(sizes: list, densities: list, repeat: int, seed: int, output):
+    for n in sizes:
+        for density in densities:
+            graph = random_graph(n, density, seed)
+            list2_by_state = {}
+            for state in Graph.State:
+                graph.set_state(state)
+                list2_by_state[state] = copy.deepcopy(graph.list2)
+            cases = [*conversion_cases(list2_by_state), *operation_cases(list2_by_state, random.Random(seed))]
+            for name, state, setup in cases:
+                result = measure(setup, repeat)
+                result.update({
+                    'benchmark': name,
+                    'state': state.name.lower(),
+                    'n': n,
+                    'density': density,
+                    'edges_number': graph.edges_number(),
+                    'numpy': numpy_backend.is_enabled(),
+                    'workers': parallel.workers_number()
+                })
+                output.write(json.dumps(result) + '\n')
+                output.flush()
+
+
+def main(arguments: list = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark graph conversions and operations')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 500])
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.01, 0.1, 0.5])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--numpy', action='store_true')
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--output', default='-')
+    arguments = parser.parse_args(arguments)
+    if arguments.numpy and not numpy_backend.enable():
+        parser.error('numpy is not available')
+    if arguments.workers != 0:
+        parallel.enable(arguments.workers, min_vertices_number=0)
+    if arguments.output == '-':
+        run(arguments.sizes, arguments.densities, arguments.repeat, arguments.seed, sys.stdout)
+    else:
+        with open(arguments.output, 'w') as output:
+            run(arguments.sizes, arguments.densities, arguments.repeat, arguments.seed, output)
+
+
+if __name__ == '__main__':
+    main()
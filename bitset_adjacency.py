@@ -0,0 +1,151 @@
+from array import array
+import re
+
+__to_bits__ = bytes.maketrans(bytes(range(256)), b'0' + b'1' * 255)
+__from_bits__ = bytes.maketrans(b'01', bytes([0, 1]))
+__bit_pattern__ = re.compile('1')
+
+
+class BitsetAdjacencyMatrix:
+    def __init__(self, n: int, rows: list, loops: dict):
+        self.n = n
+        self.rows = rows
+        self.loops = loops
+
+    @staticmethod
+    def row_from_bytes(row: bytes) -> int:
+        return int(row.translate(__to_bits__)[::-1], 2) if len(row) != 0 else 0
+
+    @staticmethod
+    def from_adjacency_matrix(adjacency_matrix):
+        n, rows, loops = len(adjacency_matrix), [], {}
+        for u, row in enumerate(adjacency_matrix):
+            row = bytes(row)
+            if row[u] != 0:
+                loops[u] = row[u]
+            rows.append(BitsetAdjacencyMatrix.row_from_bytes(row) & ~(1 << u))
+        return BitsetAdjacencyMatrix(n, rows, loops)
+
+    @staticmethod
+    def from_adjacency_list(adjacency_list: list):
+        n, rows, loops = len(adjacency_list), [], {}
+        for u, adjacency in enumerate(adjacency_list):
+            row = bytearray(n)
+            for v in adjacency:
+                row[v] += 1
+            if row[u] != 0:
+                loops[u] = row[u]
+            rows.append(BitsetAdjacencyMatrix.row_from_bytes(row) & ~(1 << u))
+        return BitsetAdjacencyMatrix(n, rows, loops)
+
+    @staticmethod
+    def from_adjacency_counts(adjacency_counts: list):
+        n, rows, loops = len(adjacency_counts), [], {}
+        for u, counts in enumerate(adjacency_counts):
+            row = bytearray(n)
+            for v, count in counts.items():
+                if u == v:
+                    loops[u] = count
+                else:
+                    row[v] = 1
+            rows.append(BitsetAdjacencyMatrix.row_from_bytes(row))
+        return BitsetAdjacencyMatrix(n, rows, loops)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, u: int) -> array:
+        if u not in range(self.n):
+            raise IndexError('row index out of range')
+        row = array('b', format(self.rows[u], f'0{self.n}b')[::-1].encode().translate(__from_bits__))
+        row[u] = self.loops.get(u, 0)
+        return row
+
+    def __iter__(self):
+        for u in range(self.n):
+            yield self[u]
+
+    def bits(self, u: int) -> list:
+        return [match.start() for match in __bit_pattern__.finditer(format(self.rows[u], 'b')[::-1])]
+
+    def successors(self, u: int) -> list:
+        successors = self.bits(u)
+        if u in self.loops:
+            i = next((i for i, v in enumerate(successors) if v > u), len(successors))
+            successors[i:i] = [u] * self.loops[u]
+        return successors
+
+    def predecessors(self, v: int) -> list:
+        mask = 1 << v
+        return [u for u, row in enumerate(self.rows) if row & mask]
+
+    def neighborhood(self, v: int) -> tuple:
+        successors, predecessors = dict.fromkeys(self.bits(v), 1), dict.fromkeys(self.predecessors(v), 1)
+        if v in self.loops:
+            successors[v] = predecessors[v] = self.loops[v]
+        return successors, predecessors
+
+    def multiplicity(self, u: int, v: int) -> int:
+        return self.loops.get(u, 0) if u == v else self.rows[u] >> v & 1
+
+    def adjacency_list(self) -> list:
+        return [array('i', self.successors(u)) for u in range(self.n)]
+
+    def adjacency_counts(self) -> list:
+        result = []
+        for u in range(self.n):
+            counts = dict.fromkeys(self.bits(u), 1)
+            if u in self.loops:
+                counts[u] = self.loops[u]
+                counts = dict(sorted(counts.items()))
+            result.append(counts)
+        return result
+
+    def edges_number(self) -> int:
+        result = len(self.loops)
+        for u in range(self.n):
+            result += sum(1 for v in self.bits(u) if v < u or self.rows[v] >> u & 1 == 0)
+        return result
+
+    def addition(self):
+        full = (1 << self.n) - 1
+        return BitsetAdjacencyMatrix(self.n, [~row & full & ~(1 << u) for u, row in enumerate(self.rows)], {})
+
+    def add_arc(self, u: int, v: int) -> None:
+        if u == v:
+            self.loops[u] = min(2, self.loops.get(u, 0) + 1)
+        else:
+            self.rows[u] |= 1 << v
+
+    def remove_arc(self, u: int, v: int) -> None:
+        if u != v:
+            self.rows[u] &= ~(1 << v)
+        elif self.loops.get(u, 0) == 1:
+            del self.loops[u]
+        elif self.loops.get(u, 0) == 2:
+            self.loops[u] = 1
+
+    def insert_vertex(self, v: int) -> None:
+        low_mask = (1 << v) - 1
+        self.rows = [row & low_mask | row >> v << (v + 1) for row in self.rows]
+        self.rows.insert(v, 0)
+        self.loops = {u + 1 if u >= v else u: count for u, count in self.loops.items()}
+        self.n += 1
+
+    def delete_vertex(self, v: int) -> None:
+        low_mask = (1 << v) - 1
+        del self.rows[v]
+        self.rows = [row & low_mask | row >> (v + 1) << v for row in self.rows]
+        self.loops = {u - 1 if u > v else u: count for u, count in self.loops.items() if u != v}
+        self.n -= 1
+
+    def identify_vertices(self, i: int, j: int) -> None:
+        i_j, j_i = self.rows[i] >> j & 1, self.rows[j] >> i & 1
+        self.rows[i] |= self.rows[j] & ~(1 << i | 1 << j)
+        for k, row in enumerate(self.rows):
+            if k != i and k != j and row >> j & 1:
+                self.rows[k] = row | 1 << i
+        self.loops.pop(i, None)
+        if i_j + j_i != 0:
+            self.loops[i] = i_j + j_i
+        self.delete_vertex(j)
@@ -1,57 +1,242 @@
-import copy
+from array import array
+from bisect import insort
+from bitset_adjacency import BitsetAdjacencyMatrix
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import contextmanager
 from enum import Enum
+from functools import wraps
+from hashlib import blake2b
+from itertools import chain
+from mapped_list2 import MappedList2
+import numpy_backend
+import parallel
+import profiling
+from sparse_incidence import SparseIncidenceMatrix
 
+__addition_table__ = bytes([1]) + bytes(255)
+__fingerprint_rounds__ = 3
 
-def adjacency_list_to_wrapper_str(adjacency_list: list) -> str:
-    data = [[f'v_{i + 1}'] for i in range(len(adjacency_list))]
-    columns_sizes = [0] * (len(data) + 1)
-    for i in range(len(data)):
-        columns_sizes[0] = max(columns_sizes[0], len(data[i][0]))
-        for k, j in enumerate(adjacency_list[i], start=1):
-            data[i].append(f'v_{j + 1}')
-            columns_sizes[k] = max(columns_sizes[k], len(data[i][-1]))
-    result = ''
-    for i, row in enumerate(data):
-        result += f'{row[0].ljust(columns_sizes[0])}: '
-        result += ' '.join([element.ljust(columns_sizes[j]) for j, element in enumerate(row[1:], start=1)])
-        if i != len(data) - 1:
-            result += '\r\n'
+
+def rows_columns_sizes(rows) -> list:
+    result = []
+    for row in rows:
+        result.extend([0] * (len(row) - len(result)))
+        for j, element in enumerate(row):
+            result[j] = max(result[j], len(element))
     return result
 
 
+def labeled_rows_to_lines(get_rows):
+    columns_sizes = rows_columns_sizes(get_rows())
+    for row in get_rows():
+        yield f'{row[0].ljust(columns_sizes[0])}: ' + ' '.join([element.ljust(columns_sizes[j])
+                                                                for j, element in enumerate(row[1:], start=1)])
+
+
+def labeled_rows_to_str(data: list) -> str:
+    return '\r\n'.join(labeled_rows_to_lines(lambda: data))
+
+
+def adjacency_list_to_wrapper_lines(adjacency_list: list, rows: slice = slice(None), columns: slice = slice(None)):
+    return labeled_rows_to_lines(lambda: ([f'v_{i + 1}'] + [f'v_{j + 1}' for j in adjacency_list[i][columns]]
+                                          for i in range(len(adjacency_list))[rows]))
+
+
+def adjacency_list_to_wrapper_str(adjacency_list: list) -> str:
+    return '\r\n'.join(adjacency_list_to_wrapper_lines(adjacency_list))
+
+
+def sparse_incidence_matrix_to_wrapper_lines(sparse_incidence_matrix: SparseIncidenceMatrix,
+                                             rows: slice = slice(None), columns: slice = slice(None)):
+    return labeled_rows_to_lines(lambda: ([f'e_{k + 1}'] + [f'v_{i + 1}({degree})'
+                                                            for i, degree in sparse_incidence_matrix.column(k)[columns]]
+                                          for k in range(sparse_incidence_matrix.edges_number())[rows]))
+
+
+def sparse_incidence_matrix_to_wrapper_str(sparse_incidence_matrix: SparseIncidenceMatrix) -> str:
+    return '\r\n'.join(sparse_incidence_matrix_to_wrapper_lines(sparse_incidence_matrix))
+
+
+def str_data_matrix_to_lines(get_rows):
+    columns_sizes = rows_columns_sizes(get_rows())
+    for row in get_rows():
+        yield row[0].ljust(columns_sizes[0]) + ' '.join([element.rjust(columns_sizes[j])
+                                                         for j, element in enumerate(row[1:], start=1)])
+
+
 def str_data_matrix_to_str(data: list) -> str:
-    columns_sizes = [max([len(data[i][j]) for i in range(len(data))]) for j in range(len(data[0]))]
-    result = ''
-    for i, row in enumerate(data):
-        result += data[i][0].ljust(columns_sizes[0])
-        result += ' '.join([element.rjust(columns_sizes[j]) for j, element in enumerate(row[1:], start=1)])
-        if i != len(data) - 1:
-            result += '\r\n'
-    return result
+    return '\r\n'.join(str_data_matrix_to_lines(lambda: data))
+
+
+def matrix_to_wrapper_lines(matrix: list, rows_infix: str, columns_infix: str,
+                            rows: slice = slice(None), columns: slice = slice(None)):
+    rows_range = range(len(matrix))[rows]
+    columns_range = range(len(matrix[0]) if len(matrix) != 0 else 0)[columns]
+
+    def get_rows():
+        yield [' '] + [f'{columns_infix}_{j + 1}' for j in columns_range]
+        for i in rows_range:
+            yield [f'{rows_infix}_{i + 1}'] + [str(element) for element in matrix[i][columns]]
+    return str_data_matrix_to_lines(get_rows)
 
 
 def matrix_to_wrapper_str(matrix: list, rows_infix: str, columns_infix: str) -> str:
-    data = [[' '] * (len(matrix[0]) + 1) for _ in range(len(matrix) + 1)]
-    for j in range(1, len(matrix[0]) + 1):
-        data[0][j] = f'{columns_infix}_{j}'
-    for i in range(1, len(matrix) + 1):
-        data[i][0] = f'{rows_infix}_{i}'
-    for i in range(len(matrix)):
-        for j in range(len(matrix[0])):
-            data[i + 1][j + 1] = str(matrix[i][j])
-    return str_data_matrix_to_str(data)
+    return '\r\n'.join(matrix_to_wrapper_lines(matrix, rows_infix, columns_infix))
+
+
+def adjacency_matrix_to_wrapper_lines(adjacency_matrix: list, rows: slice = slice(None), columns: slice = slice(None)):
+    return matrix_to_wrapper_lines(adjacency_matrix, 'v', 'v', rows, columns)
 
 
 def adjacency_matrix_to_wrapper_str(adjacency_matrix: list) -> str:
-    return matrix_to_wrapper_str(adjacency_matrix, 'v', 'v')
+    return '\r\n'.join(adjacency_matrix_to_wrapper_lines(adjacency_matrix))
+
+
+def incidence_matrix_to_wrapper_lines(incidence_matrix: list, rows: slice = slice(None), columns: slice = slice(None)):
+    return matrix_to_wrapper_lines(incidence_matrix, 'v', 'e', rows, columns)
 
 
 def incidence_matrix_to_wrapper_str(incidence_matrix: list) -> str:
-    return matrix_to_wrapper_str(incidence_matrix, 'v', 'e')
+    return '\r\n'.join(incidence_matrix_to_wrapper_lines(incidence_matrix))
+
+
+def adjacency_list_to_adjacency_counts(adjacency_list: list) -> list:
+    incoming = [[] for _ in range(len(adjacency_list))]
+    for u, adjacency in enumerate(adjacency_list):
+        for v in adjacency:
+            incoming[v].append(u)
+    result = [{} for _ in range(len(adjacency_list))]
+    for v, adjacency in enumerate(incoming):
+        for u in adjacency:
+            result[u][v] = result[u].get(v, 0) + 1
+    return result
+
+
+def adjacency_matrix_to_adjacency_counts(adjacency_matrix: list) -> list:
+    if numpy_backend.is_array(adjacency_matrix):
+        return numpy_backend.adjacency_array_to_adjacency_counts(adjacency_matrix)
+    return [{v: count for v, count in enumerate(row) if count != 0} for row in adjacency_matrix]
+
+
+def adjacency_counts_to_adjacency_list(adjacency_counts: list) -> list:
+    return [array('i', [v for v, count in counts.items() for _ in range(count)]) for counts in adjacency_counts]
+
+
+def adjacency_counts_to_adjacency_matrix(adjacency_counts: list) -> list:
+    if numpy_backend.is_enabled():
+        return numpy_backend.adjacency_counts_to_adjacency_array(adjacency_counts)
+    result = [array('b', bytes(len(adjacency_counts))) for _ in range(len(adjacency_counts))]
+    for u, counts in enumerate(adjacency_counts):
+        row = result[u]
+        for v, count in counts.items():
+            row[v] = count
+    return result
+
+
+def adjacency_counts_to_incidence_columns(adjacency_counts: list) -> list:
+    result = []
+    for u, counts in enumerate(adjacency_counts):
+        for v, count in counts.items():
+            if u == v:
+                result.append(((u, count),))
+            elif adjacency_counts[v].get(u, 0) == 0:
+                result.append(((u, 1), (v, -1)) if u < v else ((v, -1), (u, 1)))
+            elif not (u > v and adjacency_counts[v][u] == 1):
+                result.append(((u, 1), (v, 1)) if u < v else ((v, 1), (u, 1)))
+    return result
+
+
+def incidence_columns_to_incidence_matrix(n: int, incidence_columns: list) -> list:
+    result = [array('b', bytes(len(incidence_columns))) for _ in range(n)]
+    for k_edge, column in enumerate(incidence_columns):
+        for i, degree in column:
+            result[i][k_edge] = degree
+    return result
+
+
+def incidence_matrix_to_incidence_columns(incidence_matrix: list) -> list:
+    result = [[] for _ in range(len(incidence_matrix[0]) if len(incidence_matrix) != 0 else 0)]
+    for i, row in enumerate(incidence_matrix):
+        for k_edge, degree in enumerate(row):
+            if degree != 0:
+                result[k_edge].append((i, degree))
+    return result
+
+
+def adjacency_counts_sorted(adjacency_counts: list) -> list:
+    incoming = [[] for _ in range(len(adjacency_counts))]
+    for u, counts in enumerate(adjacency_counts):
+        for v in counts:
+            incoming[v].append(u)
+    result = [{} for _ in range(len(adjacency_counts))]
+    for v, adjacency in enumerate(incoming):
+        for u in adjacency:
+            result[u][v] = adjacency_counts[u][v]
+    return result
+
+
+def incidence_columns_to_adjacency_counts(n: int, incidence_columns: list) -> list:
+    unsorted_counts = [{} for _ in range(n)]
+    for column in incidence_columns:
+        if len(column) == 1:
+            (i, degree), = column
+            unsorted_counts[i][i] = degree
+        elif len(column) > 1:
+            (i, i_degree), (j, j_degree) = column[0], column[1]
+            if i_degree == 1:
+                unsorted_counts[i][j] = 1
+            if j_degree == 1:
+                unsorted_counts[j][i] = 1
+    return adjacency_counts_sorted(unsorted_counts)
+
+
+def incidence_matrix_to_adjacency_counts(incidence_matrix: list) -> list:
+    return incidence_columns_to_adjacency_counts(len(incidence_matrix), incidence_matrix_to_incidence_columns(incidence_matrix))
+
+
+def sparse_incidence_matrix_to_adjacency_counts(sparse_incidence_matrix: SparseIncidenceMatrix) -> list:
+    return incidence_columns_to_adjacency_counts(len(sparse_incidence_matrix), sparse_incidence_matrix.columns())
+
+
+def adjacency_counts_to_incidence_matrix(adjacency_counts: list) -> list:
+    return incidence_columns_to_incidence_matrix(len(adjacency_counts), adjacency_counts_to_incidence_columns(adjacency_counts))
+
+
+def adjacency_counts_to_sparse_incidence_matrix(adjacency_counts: list) -> SparseIncidenceMatrix:
+    return SparseIncidenceMatrix.from_columns(len(adjacency_counts), adjacency_counts_to_incidence_columns(adjacency_counts))
+
+
+def adjacency_matrix_addition(adjacency_matrix: list) -> list:
+    if numpy_backend.is_enabled():
+        return numpy_backend.addition(adjacency_matrix)
+    if parallel.is_worth(len(adjacency_matrix)):
+        return parallel.addition(adjacency_matrix)
+    result = [array('b', bytes(row).translate(__addition_table__)) for row in adjacency_matrix]
+    for i, row in enumerate(result):
+        row[i] = 0
+    return result
+
+
+def adjacency_lists_union(adjacency_list1: list, adjacency_list2: list) -> list:
+    n1 = len(adjacency_list1)
+    return [array('i', row) for row in adjacency_list1] + [array('i', [n1 + v for v in row]) for row in adjacency_list2]
+
+
+def adjacency_matrices_union_addition(adjacency_matrix1: list, adjacency_matrix2: list) -> list:
+    if numpy_backend.is_enabled():
+        return numpy_backend.union_addition(adjacency_matrix1, adjacency_matrix2)
+    n1, n2 = len(adjacency_matrix1), len(adjacency_matrix2)
+    return ([row + array('b', [1]) * n2 for row in adjacency_matrix_addition(adjacency_matrix1)] +
+            [array('b', [1]) * n1 + row for row in adjacency_matrix_addition(adjacency_matrix2)])
 
 
 def adjacency_list_to_adjacency_matrix(adjacency_list: list) -> list:
-    result = [[0] * len(adjacency_list) for _ in range(len(adjacency_list))]
+    if parallel.is_worth(len(adjacency_list)):
+        return parallel.adjacency_list_to_adjacency_matrix(adjacency_list)
+    if numpy_backend.is_enabled():
+        return adjacency_counts_to_adjacency_matrix(adjacency_list_to_adjacency_counts(adjacency_list))
+    result = [array('b', bytes(len(adjacency_list))) for _ in range(len(adjacency_list))]
     for u, adjacency in enumerate(adjacency_list, start=0):
         for v in adjacency:
             result[u][v] += 1
@@ -59,72 +244,612 @@ def adjacency_list_to_adjacency_matrix(adjacency_list: list) -> list:
 
 
 def adjacency_list_to_incidence_matrix(adjacency_list: list) -> list:
-    return adjacency_matrix_to_incidence_matrix(adjacency_list_to_adjacency_matrix(adjacency_list))
+    return adjacency_counts_to_incidence_matrix(adjacency_list_to_adjacency_counts(adjacency_list))
 
 
 def adjacency_matrix_to_adjacency_list(adjacency_matrix: list) -> list:
-    result = [[] for _ in range(len(adjacency_matrix))]
-    for u in range(len(adjacency_matrix)):
-        for v in range(len(adjacency_matrix)):
-            for i in range(adjacency_matrix[u][v]):
-                result[u].append(v)
-    return result
+    if parallel.is_worth(len(adjacency_matrix)):
+        return parallel.adjacency_matrix_to_adjacency_list(adjacency_matrix)
+    if numpy_backend.is_array(adjacency_matrix):
+        return adjacency_counts_to_adjacency_list(adjacency_matrix_to_adjacency_counts(adjacency_matrix))
+    return [array('i', [v for v, count in enumerate(row) for _ in range(count)]) for row in adjacency_matrix]
 
 
 def adjacency_matrix_to_incidence_matrix(adjacency_matrix: list) -> list:
-    result = [[] for _ in range(len(adjacency_matrix))]
-    for u in range(len(adjacency_matrix)):
-        for v in range(len(adjacency_matrix)):
-            if adjacency_matrix[u][v] != 0:
-                if not (u > v and adjacency_matrix[v][u] == 1):
-                    for i in range(len(result)):
-                        result[i].append(0)
-                    if u == v:
-                        result[u][-1] = adjacency_matrix[u][v]
-                    elif adjacency_matrix[v][u] == 0:
-                        result[u][-1] = 1
-                        result[v][-1] = -1
-                    else:
-                        result[u][-1] = result[v][-1] = 1
-    return result
+    return adjacency_counts_to_incidence_matrix(adjacency_matrix_to_adjacency_counts(adjacency_matrix))
 
 
 def incidence_matrix_to_adjacency_list(incidence_matrix: list) -> list:
-    return adjacency_matrix_to_adjacency_list(incidence_matrix_to_adjacency_matrix(incidence_matrix))
+    return adjacency_counts_to_adjacency_list(incidence_matrix_to_adjacency_counts(incidence_matrix))
 
 
 def incidence_matrix_to_adjacency_matrix(incidence_matrix: list) -> list:
-    result = [[0] * len(incidence_matrix) for _ in range(len(incidence_matrix))]
-    for k_edge in range(len(incidence_matrix[0])):
-        non_zeros = [(i, degree) for i in range(len(incidence_matrix)) if (degree := incidence_matrix[i][k_edge]) != 0]
-        if len(non_zeros) == 1:
-            i, degree = non_zeros[0]
-            result[i][i] = degree
+    return adjacency_counts_to_adjacency_matrix(incidence_matrix_to_adjacency_counts(incidence_matrix))
+
+
+def adjacency_list_to_sparse_incidence_matrix(adjacency_list: list) -> SparseIncidenceMatrix:
+    return adjacency_counts_to_sparse_incidence_matrix(adjacency_list_to_adjacency_counts(adjacency_list))
+
+
+def adjacency_matrix_to_sparse_incidence_matrix(adjacency_matrix: list) -> SparseIncidenceMatrix:
+    return adjacency_counts_to_sparse_incidence_matrix(adjacency_matrix_to_adjacency_counts(adjacency_matrix))
+
+
+def incidence_matrix_to_sparse_incidence_matrix(incidence_matrix: list) -> SparseIncidenceMatrix:
+    incidence_columns = incidence_matrix_to_incidence_columns(incidence_matrix)
+    return SparseIncidenceMatrix.from_columns(len(incidence_matrix), incidence_columns)
+
+
+def sparse_incidence_matrix_to_adjacency_list(sparse_incidence_matrix: SparseIncidenceMatrix) -> list:
+    return adjacency_counts_to_adjacency_list(sparse_incidence_matrix_to_adjacency_counts(sparse_incidence_matrix))
+
+
+def sparse_incidence_matrix_to_adjacency_matrix(sparse_incidence_matrix: SparseIncidenceMatrix) -> list:
+    return adjacency_counts_to_adjacency_matrix(sparse_incidence_matrix_to_adjacency_counts(sparse_incidence_matrix))
+
+
+def sparse_incidence_matrix_to_incidence_matrix(sparse_incidence_matrix: SparseIncidenceMatrix) -> list:
+    n = len(sparse_incidence_matrix)
+    return incidence_columns_to_incidence_matrix(n, list(sparse_incidence_matrix.columns()))
+
+
+def adjacency_list_to_bitset_adjacency_matrix(adjacency_list: list) -> BitsetAdjacencyMatrix:
+    return BitsetAdjacencyMatrix.from_adjacency_list(adjacency_list)
+
+
+def adjacency_matrix_to_bitset_adjacency_matrix(adjacency_matrix: list) -> BitsetAdjacencyMatrix:
+    return BitsetAdjacencyMatrix.from_adjacency_matrix(adjacency_matrix)
+
+
+def incidence_matrix_to_bitset_adjacency_matrix(incidence_matrix: list) -> BitsetAdjacencyMatrix:
+    return BitsetAdjacencyMatrix.from_adjacency_counts(incidence_matrix_to_adjacency_counts(incidence_matrix))
+
+
+def sparse_incidence_matrix_to_bitset_adjacency_matrix(sparse_incidence_matrix: SparseIncidenceMatrix) -> BitsetAdjacencyMatrix:
+    return BitsetAdjacencyMatrix.from_adjacency_counts(sparse_incidence_matrix_to_adjacency_counts(sparse_incidence_matrix))
+
+
+def bitset_adjacency_matrix_to_adjacency_counts(bitset_adjacency_matrix: BitsetAdjacencyMatrix) -> list:
+    return bitset_adjacency_matrix.adjacency_counts()
+
+
+def bitset_adjacency_matrix_to_adjacency_list(bitset_adjacency_matrix: BitsetAdjacencyMatrix) -> list:
+    return bitset_adjacency_matrix.adjacency_list()
+
+
+def bitset_adjacency_matrix_to_adjacency_matrix(bitset_adjacency_matrix: BitsetAdjacencyMatrix) -> list:
+    if numpy_backend.is_enabled():
+        return adjacency_counts_to_adjacency_matrix(bitset_adjacency_matrix.adjacency_counts())
+    return list(bitset_adjacency_matrix)
+
+
+def bitset_adjacency_matrix_to_incidence_matrix(bitset_adjacency_matrix: BitsetAdjacencyMatrix) -> list:
+    return adjacency_counts_to_incidence_matrix(bitset_adjacency_matrix.adjacency_counts())
+
+
+def bitset_adjacency_matrix_to_sparse_incidence_matrix(bitset_adjacency_matrix: BitsetAdjacencyMatrix) -> SparseIncidenceMatrix:
+    return adjacency_counts_to_sparse_incidence_matrix(bitset_adjacency_matrix.adjacency_counts())
+
+
+def adjacency_counts_add_directed_edge(adjacency_counts: list, i: int, j: int) -> None:
+    count = adjacency_counts[i].get(j, 0)
+    if i == j:
+        adjacency_counts[i][i] = min(2, count + 1)
+    elif count == 0:
+        adjacency_counts[i][j] = 1
+
+
+def adjacency_counts_remove_directed_edge(adjacency_counts: list, i: int, j: int) -> None:
+    count = adjacency_counts[i].get(j, 0)
+    if count in [1, 2]:
+        if count == 1:
+            del adjacency_counts[i][j]
         else:
-            (i, i_degree), (j, j_degree) = non_zeros[0], non_zeros[1]
+            adjacency_counts[i][j] = 1
+
+
+def adjacency_counts_add_vertex(adjacency_counts: list, v: int) -> None:
+    for u, counts in enumerate(adjacency_counts):
+        if any(w >= v for w in counts):
+            adjacency_counts[u] = {w + 1 if w >= v else w: count for w, count in counts.items()}
+    adjacency_counts.insert(v, {})
+
+
+def adjacency_counts_remove_vertices(adjacency_counts: list, vertices: list) -> None:
+    removed, new_vertices, k = set(vertices), [], 0
+    for v in range(len(adjacency_counts)):
+        new_vertices.append(None if v in removed else k)
+        k += v not in removed
+    adjacency_counts[:] = [{new_vertices[w]: count for w, count in counts.items() if new_vertices[w] is not None}
+                           for v, counts in enumerate(adjacency_counts) if new_vertices[v] is not None]
+
+
+def adjacency_counts_remove_vertex(adjacency_counts: list, v: int) -> None:
+    del adjacency_counts[v]
+    for u, counts in enumerate(adjacency_counts):
+        counts.pop(v, None)
+        if any(w > v for w in counts):
+            adjacency_counts[u] = {w - 1 if w > v else w: count for w, count in counts.items()}
+
+
+def adjacency_counts_identify_vertices(adjacency_counts: list, i: int, j: int) -> None:
+    counts_i, counts_j = adjacency_counts[i], adjacency_counts[j]
+    i_j, j_i = counts_i.get(j, 0), counts_j.get(i, 0)
+    touched = {i}
+    for k, count in counts_j.items():
+        if k != i and k != j and count == 1:
+            counts_i[k] = 1
+    for k, counts_k in enumerate(adjacency_counts):
+        if k != i and k != j and counts_k.get(j, 0) == 1:
+            counts_k[i] = 1
+            touched.add(k)
+    counts_i.pop(i, None)
+    if i_j == j_i == 1:
+        counts_i[i] = 2
+    elif i_j == 1 or j_i == 1:
+        counts_i[i] = 1
+    for k in touched:
+        adjacency_counts[k] = dict(sorted(adjacency_counts[k].items()))
+    adjacency_counts_remove_vertex(adjacency_counts, j)
+
+
+def adjacency_list_add_vertex(adjacency_list: list, v: int) -> list:
+    for u, adjacency in enumerate(adjacency_list):
+        adjacency_list[u] = array('i', [w + 1 if w >= v else w for w in adjacency])
+    adjacency_list.insert(v, array('i'))
+    return adjacency_list
+
+
+def adjacency_list_remove_vertex(adjacency_list: list, v: int) -> list:
+    del adjacency_list[v]
+    for u, adjacency in enumerate(adjacency_list):
+        adjacency_list[u] = array('i', [w - 1 if w > v else w for w in adjacency if w != v])
+    return adjacency_list
+
+
+def adjacency_list_identify_vertices(adjacency_list: list, i: int, j: int) -> list:
+    adjacency_counts = adjacency_list_to_adjacency_counts(adjacency_list)
+    adjacency_counts_identify_vertices(adjacency_counts, i, j)
+    return adjacency_counts_to_adjacency_list(adjacency_counts)
+
+
+def adjacency_list_add_directed_edge(adjacency_list: list, i: int, j: int) -> list:
+    count = adjacency_list[i].count(j)
+    if count == 0 or i == j and count < 2:
+        insort(adjacency_list[i], j)
+    return adjacency_list
+
+
+def adjacency_list_remove_directed_edge(adjacency_list: list, i: int, j: int) -> list:
+    if adjacency_list[i].count(j) in [1, 2]:
+        adjacency_list[i].remove(j)
+    return adjacency_list
+
+
+def adjacency_matrix_add_directed_edge(adjacency_matrix: list, i: int, j: int) -> list:
+    if i == j:
+        adjacency_matrix[i][i] = min(2, adjacency_matrix[i][i] + 1)
+    elif adjacency_matrix[i][j] == 0:
+        adjacency_matrix[i][j] = 1
+    return adjacency_matrix
+
+
+def adjacency_matrix_remove_directed_edge(adjacency_matrix: list, i: int, j: int) -> list:
+    if adjacency_matrix[i][j] in [1, 2]:
+        adjacency_matrix[i][j] -= 1
+    return adjacency_matrix
+
+
+def adjacency_matrix_add_vertex(adjacency_matrix: list, v: int) -> list:
+    if numpy_backend.is_array(adjacency_matrix):
+        return numpy_backend.insert_vertex(adjacency_matrix, v)
+    for row in adjacency_matrix:
+        row.insert(v, 0)
+    adjacency_matrix.insert(v, array('b', bytes(len(adjacency_matrix) + 1)))
+    return adjacency_matrix
+
+
+def adjacency_matrix_remove_vertex(adjacency_matrix: list, v: int) -> list:
+    if numpy_backend.is_array(adjacency_matrix):
+        return numpy_backend.delete_vertex(adjacency_matrix, v)
+    del adjacency_matrix[v]
+    for row in adjacency_matrix:
+        del row[v]
+    return adjacency_matrix
+
+
+def adjacency_matrix_identify_vertices(adjacency_matrix: list, i: int, j: int) -> list:
+    for k in range(len(adjacency_matrix)):
+        if k != i and k != j:
+            if adjacency_matrix[j][k] == 1:
+                adjacency_matrix[i][k] = 1
+            if adjacency_matrix[k][j] == 1:
+                adjacency_matrix[k][i] = 1
+    if adjacency_matrix[i][j] == adjacency_matrix[j][i] == 1:
+        adjacency_matrix[i][i] = 2
+    elif adjacency_matrix[i][j] == 1 or adjacency_matrix[j][i] == 1:
+        adjacency_matrix[i][i] = 1
+    else:
+        adjacency_matrix[i][i] = 0
+    return adjacency_matrix_remove_vertex(adjacency_matrix, j)
+
+
+def incidence_columns_identify_vertices(n: int, incidence_columns: list, i: int, j: int) -> list:
+    adjacency_counts = incidence_columns_to_adjacency_counts(n, incidence_columns)
+    adjacency_counts_identify_vertices(adjacency_counts, i, j)
+    return adjacency_counts_to_incidence_columns(adjacency_counts)
+
+
+def incidence_matrix_column(incidence_matrix: list, k_edge: int) -> tuple:
+    return tuple((i, row[k_edge]) for i, row in enumerate(incidence_matrix) if row[k_edge] != 0)
+
+
+def incidence_matrix_touching_columns(incidence_matrix: list, vertices: list) -> list:
+    result = set()
+    for v in vertices:
+        for k_edge, degree in enumerate(incidence_matrix[v]):
+            if degree != 0 and k_edge not in result:
+                first_rows = [i for i, _ in incidence_matrix_column(incidence_matrix, k_edge)[:2]]
+                if v in first_rows:
+                    result.add(k_edge)
+    return sorted(result)
+
+
+def incidence_matrix_edit(incidence_matrix: list, removed_columns: list = (), removed_row: int = None,
+                          appended_columns: list = ()) -> list:
+    for row in incidence_matrix:
+        for k_edge in reversed(removed_columns):
+            del row[k_edge]
+    if removed_row is not None:
+        del incidence_matrix[removed_row]
+    for row in incidence_matrix:
+        row.extend([0] * len(appended_columns))
+    m = len(incidence_matrix[0]) if len(incidence_matrix) != 0 else 0
+    for k_edge, column in enumerate(appended_columns, start=m - len(appended_columns)):
+        for i, degree in column:
+            incidence_matrix[i][k_edge] = degree
+    return incidence_matrix
+
+
+def incidence_matrix_add_vertex(incidence_matrix: list, v: int) -> list:
+    incidence_matrix.insert(v, array('b', bytes(len(incidence_matrix[0]) if len(incidence_matrix) != 0 else 0)))
+    return incidence_matrix
+
+
+def incidence_matrix_remove_vertex(incidence_matrix: list, v: int) -> list:
+    return incidence_matrix_edit(incidence_matrix, incidence_matrix_touching_columns(incidence_matrix, [v]), v)
+
+
+def incidence_matrix_identify_vertices(incidence_matrix: list, i: int, j: int) -> list:
+    touching_columns = incidence_matrix_touching_columns(incidence_matrix, [i, j])
+    incidence_columns = [incidence_matrix_column(incidence_matrix, k_edge) for k_edge in touching_columns]
+    appended_columns = incidence_columns_identify_vertices(len(incidence_matrix), incidence_columns, i, j)
+    return incidence_matrix_edit(incidence_matrix, touching_columns, j, appended_columns)
+
+
+def sparse_incidence_matrix_add_vertex(sparse_incidence_matrix: SparseIncidenceMatrix,
+                                       v: int) -> SparseIncidenceMatrix:
+    return sparse_incidence_matrix.edit(inserted_row=v)
+
+
+def sparse_incidence_matrix_remove_vertex(sparse_incidence_matrix: SparseIncidenceMatrix,
+                                          v: int) -> SparseIncidenceMatrix:
+    return sparse_incidence_matrix.edit(sparse_incidence_matrix.touching_columns([v]), v)
+
+
+def sparse_incidence_matrix_identify_vertices(sparse_incidence_matrix: SparseIncidenceMatrix,
+                                              i: int, j: int) -> SparseIncidenceMatrix:
+    touching_columns = sparse_incidence_matrix.touching_columns([i, j])
+    incidence_columns = [sparse_incidence_matrix.column(k_edge) for k_edge in touching_columns]
+    appended_columns = incidence_columns_identify_vertices(len(sparse_incidence_matrix), incidence_columns, i, j)
+    return sparse_incidence_matrix.edit(touching_columns, j, appended_columns=appended_columns)
+
+
+def bitset_adjacency_matrix_add_directed_edge(bitset_adjacency_matrix: BitsetAdjacencyMatrix,
+                                              i: int, j: int) -> BitsetAdjacencyMatrix:
+    bitset_adjacency_matrix.add_arc(i, j)
+    return bitset_adjacency_matrix
+
+
+def bitset_adjacency_matrix_remove_directed_edge(bitset_adjacency_matrix: BitsetAdjacencyMatrix,
+                                                 i: int, j: int) -> BitsetAdjacencyMatrix:
+    bitset_adjacency_matrix.remove_arc(i, j)
+    return bitset_adjacency_matrix
+
+
+def bitset_adjacency_matrix_add_vertex(bitset_adjacency_matrix: BitsetAdjacencyMatrix, v: int) -> BitsetAdjacencyMatrix:
+    bitset_adjacency_matrix.insert_vertex(v)
+    return bitset_adjacency_matrix
+
+
+def bitset_adjacency_matrix_remove_vertex(bitset_adjacency_matrix: BitsetAdjacencyMatrix, v: int) -> BitsetAdjacencyMatrix:
+    bitset_adjacency_matrix.delete_vertex(v)
+    return bitset_adjacency_matrix
+
+
+def bitset_adjacency_matrix_identify_vertices(bitset_adjacency_matrix: BitsetAdjacencyMatrix,
+                                              i: int, j: int) -> BitsetAdjacencyMatrix:
+    bitset_adjacency_matrix.identify_vertices(i, j)
+    return bitset_adjacency_matrix
+
+
+def adjacency_list_arcs(adjacency_list: list):
+    for u, adjacency in enumerate(adjacency_list):
+        for v in adjacency:
+            yield u, v
+
+
+def adjacency_matrix_arcs(adjacency_matrix: list):
+    for u, row in enumerate(adjacency_matrix):
+        columns = row.nonzero()[0].tolist() if numpy_backend.is_array(row) else (v for v, count in enumerate(row) if count)
+        for v in columns:
+            for _ in range(row[v]):
+                yield u, v
+
+
+def incidence_columns_arcs(incidence_columns):
+    for column in incidence_columns:
+        if len(column) == 1:
+            (i, degree), = column
+            for _ in range(degree):
+                yield i, i
+        elif len(column) > 1:
+            (i, i_degree), (j, j_degree) = column[0], column[1]
             if i_degree == 1:
-                result[i][j] = 1
+                yield i, j
             if j_degree == 1:
-                result[j][i] = 1
+                yield j, i
+
+
+def incidence_matrix_arcs(incidence_matrix: list):
+    return incidence_columns_arcs(incidence_matrix_to_incidence_columns(incidence_matrix))
+
+
+def sparse_incidence_matrix_arcs(sparse_incidence_matrix: SparseIncidenceMatrix):
+    return incidence_columns_arcs(sparse_incidence_matrix.columns())
+
+
+def bitset_adjacency_matrix_arcs(bitset_adjacency_matrix: BitsetAdjacencyMatrix):
+    for u in range(len(bitset_adjacency_matrix)):
+        for v in bitset_adjacency_matrix.successors(u):
+            yield u, v
+
+
+def adjacency_list_degrees(adjacency_list: list) -> tuple:
+    if parallel.is_worth(len(adjacency_list)):
+        return parallel.adjacency_list_degrees(adjacency_list)
+    in_degrees, out_degrees = array('q', bytes(8 * len(adjacency_list))), array('q', bytes(8 * len(adjacency_list)))
+    for u, adjacency in enumerate(adjacency_list):
+        out_degrees[u] = len(adjacency)
+        for v in adjacency:
+            in_degrees[v] += 1
+    return in_degrees, out_degrees
+
+
+def adjacency_counts_degrees(adjacency_counts: list) -> tuple:
+    in_degrees, out_degrees = array('q', bytes(8 * len(adjacency_counts))), array('q', bytes(8 * len(adjacency_counts)))
+    for u, counts in enumerate(adjacency_counts):
+        for v, count in counts.items():
+            out_degrees[u] += count
+            in_degrees[v] += count
+    return in_degrees, out_degrees
+
+
+def adjacency_list_neighbor_index(adjacency_list: list) -> tuple:
+    successors, predecessors = [{} for _ in range(len(adjacency_list))], [{} for _ in range(len(adjacency_list))]
+    for u, adjacency in enumerate(adjacency_list):
+        for v in adjacency:
+            successors[u][v] = successors[u].get(v, 0) + 1
+            predecessors[v][u] = predecessors[v].get(u, 0) + 1
+    return successors, predecessors
+
+
+def label_digest(value) -> bytes:
+    return blake2b(repr(value).encode(), digest_size=8).digest()
+
+
+def degrees_fingerprint(in_degrees: list, out_degrees: list) -> str:
+    digest = blake2b(repr(sorted(Counter(zip(in_degrees, out_degrees)).items())).encode(), digest_size=16)
+    return f'{len(in_degrees)}:{sum(out_degrees)}:{digest.hexdigest()}'
+
+
+def neighbor_index_fingerprint(successors: list, predecessors: list) -> str:
+    n = len(successors)
+    degree_sequence = [(sum(predecessors[v].values()), sum(successors[v].values())) for v in range(n)]
+    labels = [label_digest((*degree_sequence[v], successors[v].get(v, 0))) for v in range(n)]
+    for _ in range(__fingerprint_rounds__):
+        labels = [label_digest((labels[v], sorted((labels[w], count) for w, count in successors[v].items()),
+                                sorted((labels[u], count) for u, count in predecessors[v].items())))
+                  for v in range(n)]
+    digest = blake2b(repr(sorted(degree_sequence)).encode(), digest_size=16)
+    digest.update(b''.join(sorted(labels)))
+    return f'{n}:{sum(out_degree for _, out_degree in degree_sequence)}:{digest.hexdigest()}'
+
+
+def adjacency_counts_neighborhood(adjacency_counts: list, v: int) -> tuple:
+    return dict(adjacency_counts[v]), {u: counts[v] for u, counts in enumerate(adjacency_counts) if v in counts}
+
+
+def adjacency_list_neighborhood(adjacency_list: list, v: int) -> tuple:
+    successors, predecessors = {}, {}
+    for w in adjacency_list[v]:
+        successors[w] = successors.get(w, 0) + 1
+    for u, adjacency in enumerate(adjacency_list):
+        count = sum(1 for w in adjacency if w == v)
+        if count != 0:
+            predecessors[u] = count
+    return successors, predecessors
+
+
+def adjacency_matrix_neighborhood(adjacency_matrix: list, v: int) -> tuple:
+    return ({w: int(count) for w, count in enumerate(adjacency_matrix[v]) if count != 0},
+            {u: int(row[v]) for u, row in enumerate(adjacency_matrix) if row[v] != 0})
+
+
+def incidence_columns_neighborhood(incidence_columns: list, v: int) -> tuple:
+    successors, predecessors = {}, {}
+    for column in incidence_columns:
+        if len(column) == 1:
+            (i, degree), = column
+            successors[i] = predecessors[i] = degree
+        elif len(column) > 1:
+            (i, i_degree), (j, j_degree) = column[0], column[1]
+            for (u, u_degree), w in [((i, i_degree), j), ((j, j_degree), i)]:
+                if u_degree == 1 and u == v:
+                    successors[w] = 1
+                elif u_degree == 1 and w == v:
+                    predecessors[u] = 1
+    return successors, predecessors
+
+
+def incidence_matrix_neighborhood(incidence_matrix: list, v: int) -> tuple:
+    touching_columns = incidence_matrix_touching_columns(incidence_matrix, [v])
+    incidence_columns = [incidence_matrix_column(incidence_matrix, k_edge) for k_edge in touching_columns]
+    return incidence_columns_neighborhood(incidence_columns, v)
+
+
+def sparse_incidence_matrix_neighborhood(sparse_incidence_matrix: SparseIncidenceMatrix, v: int) -> tuple:
+    touching_columns = sparse_incidence_matrix.touching_columns([v])
+    incidence_columns = [sparse_incidence_matrix.column(k_edge) for k_edge in touching_columns]
+    return incidence_columns_neighborhood(incidence_columns, v)
+
+
+def bitset_adjacency_matrix_neighborhood(bitset_adjacency_matrix: BitsetAdjacencyMatrix, v: int) -> tuple:
+    return bitset_adjacency_matrix.neighborhood(v)
+
+
+def sorted_row(row):
+    return row if all(row[k] <= row[k + 1] for k in range(len(row) - 1)) else sorted(row)
+
+
+def sorted_rows_intersection(row1, row2) -> array:
+    result, k1, k2 = array('i'), 0, 0
+    while k1 < len(row1) and k2 < len(row2):
+        if row1[k1] < row2[k2]:
+            k1 += 1
+        elif row1[k1] > row2[k2]:
+            k2 += 1
+        else:
+            result.append(row1[k1])
+            k1 += 1
+            k2 += 1
+    return result
+
+
+def sorted_rows_symmetric_difference(row1, row2) -> array:
+    result, k1, k2 = array('i'), 0, 0
+    while k1 < len(row1) and k2 < len(row2):
+        if row1[k1] < row2[k2]:
+            result.append(row1[k1])
+            k1 += 1
+        elif row1[k1] > row2[k2]:
+            result.append(row2[k2])
+            k2 += 1
+        else:
+            k1 += 1
+            k2 += 1
+    result.extend(row1[k1:])
+    result.extend(row2[k2:])
+    return result
+
+
+def adjacency_lists_intersection(adjacency_list1: list, adjacency_list2: list) -> list:
+    return [sorted_rows_intersection(sorted_row(adjacency_list1[u]), sorted_row(adjacency_list2[u]))
+            for u in range(min(len(adjacency_list1), len(adjacency_list2)))]
+
+
+def adjacency_lists_symmetric_difference(adjacency_list1: list, adjacency_list2: list) -> list:
+    n1, n2 = len(adjacency_list1), len(adjacency_list2)
+    return [sorted_rows_symmetric_difference(sorted_row(adjacency_list1[u]) if u < n1 else (),
+                                             sorted_row(adjacency_list2[u]) if u < n2 else ())
+            for u in range(max(n1, n2))]
+
+
+def adjacency_counts_multiplicity(adjacency_counts: list, u: int, v: int) -> int:
+    return adjacency_counts[u].get(v, 0) if u < len(adjacency_counts) else 0
+
+
+def combined_adjacency_counts_edges_number(adjacency_counts1: list, adjacency_counts2: list, combine) -> int:
+    result = 0
+    for u in range(max(len(adjacency_counts1), len(adjacency_counts2))):
+        vertices = set(adjacency_counts1[u] if u < len(adjacency_counts1) else ())
+        vertices.update(adjacency_counts2[u] if u < len(adjacency_counts2) else ())
+        for v in vertices:
+            if combine(adjacency_counts_multiplicity(adjacency_counts1, u, v),
+                       adjacency_counts_multiplicity(adjacency_counts2, u, v)) == 0:
+                continue
+            if u <= v or combine(adjacency_counts_multiplicity(adjacency_counts1, v, u),
+                                 adjacency_counts_multiplicity(adjacency_counts2, v, u)) == 0:
+                result += 1
     return result
 
 
+def list2_copy(list2):
+    if numpy_backend.is_array(list2):
+        return list2.copy()
+    if isinstance(list2, MappedList2):
+        return list2.materialize()
+    if isinstance(list2, SparseIncidenceMatrix):
+        return list2
+    if isinstance(list2, BitsetAdjacencyMatrix):
+        return BitsetAdjacencyMatrix(list2.n, list(list2.rows), dict(list2.loops))
+    return [row[:] for row in list2]
+
+
+def restore_arcs_operations(v: int, successors: dict, predecessors: dict, restored: set) -> list:
+    operations = [('add_directed_edge', ((v, w),)) for w, count in successors.items() for _ in range(count)]
+    return operations + [('add_directed_edge', ((u, v),)) for u, count in predecessors.items() if u not in restored
+                         for _ in range(count)]
+
+
+def journal_argument(argument):
+    return tuple(argument) if isinstance(argument, Iterable) and not isinstance(argument, (str, tuple)) else argument
+
+
+def journaled(method):
+    @wraps(method)
+    def wrapper(graph, *args) -> None:
+        if graph.__undo__ is None or graph.__journal_group__ is not None:
+            return method(graph, *args)
+        args = tuple(journal_argument(argument) for argument in args)
+        graph.__journal_group__ = []
+        try:
+            method(graph, *args)
+            inverse_operations = [operation for operations in reversed(graph.__journal_group__)
+                                  for operation in operations]
+        finally:
+            graph.__journal_group__ = None
+        graph.__push_journal__((method.__name__, args), inverse_operations)
+    return wrapper
+
+
 class Graph:
+    __slots__ = ('state', 'name', '__views__', '__dirty__', '__mutations__', '__batch__', '__batch_depth__',
+                 '__in_degrees__', '__out_degrees__', '__successors__', '__predecessors__', '__version__', '__memo__',
+                 '__memo_version__', '__undo__', '__redo__', '__journal_group__')
+    __memo_size__ = 16
+    __journal_size__ = 256
+
     class State(Enum):
         ADJACENCY_LIST = 1
         ADJACENCY_MATRIX = 2
         INCIDENCE_MATRIX = 3
+        SPARSE_INCIDENCE = 4
+        BITSET_ADJACENCY = 5
 
         @staticmethod
         def get_names() -> list:
-            return ['adjacent list', 'adjacent matrix', 'incidence matrix']
+            return ['adjacent list', 'adjacent matrix', 'incidence matrix', 'sparse incidence matrix',
+                    'bitset adjacency matrix']
 
         @staticmethod
         def get_by_name(name: str):
             name_to_state = {
                 'adjacent list': Graph.State.ADJACENCY_LIST,
                 'adjacent matrix': Graph.State.ADJACENCY_MATRIX,
-                'incidence matrix': Graph.State.INCIDENCE_MATRIX
+                'incidence matrix': Graph.State.INCIDENCE_MATRIX,
+                'sparse incidence matrix': Graph.State.SPARSE_INCIDENCE,
+                'bitset adjacency matrix': Graph.State.BITSET_ADJACENCY
             }
             return name_to_state[name]
 
@@ -133,172 +858,1005 @@ class Graph:
             state_to_name = {
                 Graph.State.ADJACENCY_LIST: 'adjacent list',
                 Graph.State.ADJACENCY_MATRIX: 'adjacent matrix',
-                Graph.State.INCIDENCE_MATRIX: 'incidence matrix'
+                Graph.State.INCIDENCE_MATRIX: 'incidence matrix',
+                Graph.State.SPARSE_INCIDENCE: 'sparse incidence matrix',
+                Graph.State.BITSET_ADJACENCY: 'bitset adjacency matrix'
             }
             return state_to_name[state]
 
     def __init__(self, list2: list, state: State, name: str = ''):
-        self.list2 = list2
         self.state = state
         self.name = 'unnamed' if str == '' else name
+        self.__views__ = {state: None for state in Graph.State}
+        self.__dirty__ = {state: True for state in Graph.State}
+        self.__mutations__ = None
+        self.__batch__ = None
+        self.__batch_depth__ = 0
+        self.__in_degrees__ = None
+        self.__out_degrees__ = None
+        self.__successors__ = None
+        self.__predecessors__ = None
+        self.__version__ = 0
+        self.__memo__ = {}
+        self.__memo_version__ = 0
+        self.__undo__ = None
+        self.__redo__ = None
+        self.__journal_group__ = None
+        self.list2 = list2
 
-    def __str__(self):
-        title = f"Graph: '{self.name}'\r\n"
-        state_to_wrapper_str = {
-            Graph.State.ADJACENCY_LIST: adjacency_list_to_wrapper_str,
-            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_to_wrapper_str,
-            Graph.State.INCIDENCE_MATRIX: incidence_matrix_to_wrapper_str
-        }
-        return title + state_to_wrapper_str[self.state](self.list2)
+    def __getstate__(self) -> dict:
+        clean_state = self.__clean_state__()
+        attributes = {name: getattr(self, name) for name in Graph.__slots__}
+        list2 = self.__views__[clean_state]
+        attributes['__views__'] = {state: None for state in Graph.State}
+        if numpy_backend.is_array(list2):
+            list2 = [array('b', row.tobytes()) for row in list2]
+        attributes['__views__'][clean_state] = list2
+        attributes['__dirty__'] = {state: state != clean_state for state in Graph.State}
+        attributes['__mutations__'] = None
+        attributes['__batch_depth__'] = 0
+        attributes['__in_degrees__'] = None
+        attributes['__out_degrees__'] = None
+        attributes['__successors__'] = None
+        attributes['__predecessors__'] = None
+        attributes['__memo__'] = {}
+        attributes['__undo__'] = None
+        attributes['__redo__'] = None
+        attributes['__journal_group__'] = None
+        return attributes
 
-    def edges_number(self) -> int:
-        state = self.state
-        self.set_state(Graph.State.INCIDENCE_MATRIX)
-        result = 0
-        if len(self.list2) != 0:
-            result = len(self.list2[0])
-        self.set_state(state)
-        return result
+    def __setstate__(self, attributes: dict) -> None:
+        if '__views__' not in attributes:
+            list2 = attributes.pop('list2')
+            for name, value in attributes.items():
+                setattr(self, name, value)
+            self.__views__ = {state: None for state in Graph.State}
+            self.__dirty__ = {state: True for state in Graph.State}
+            self.__mutations__ = None
+            self.__batch__ = None
+            self.__batch_depth__ = 0
+            self.__in_degrees__ = None
+            self.__out_degrees__ = None
+            self.__successors__ = None
+            self.__predecessors__ = None
+            self.__version__ = 0
+            self.__memo__ = {}
+            self.__memo_version__ = 0
+            self.__undo__ = None
+            self.__redo__ = None
+            self.__journal_group__ = None
+            self.list2 = list2
+            return
+        self.__mutations__ = None
+        self.__batch__ = None
+        self.__batch_depth__ = 0
+        self.__in_degrees__ = None
+        self.__out_degrees__ = None
+        self.__successors__ = None
+        self.__predecessors__ = None
+        self.__version__ = 0
+        self.__memo__ = {}
+        self.__memo_version__ = 0
+        self.__undo__ = None
+        self.__redo__ = None
+        self.__journal_group__ = None
+        for name, value in attributes.items():
+            setattr(self, name, value)
 
-    @staticmethod
-    def addition(graph):
-        new_graph = copy.deepcopy(graph)
-        state = new_graph.state
-        new_graph.set_state(Graph.State.ADJACENCY_MATRIX)
-        n = len(new_graph.vertices())
-        for i in range(n):
-            for j in range(n):
-                new_graph.list2[i][j] = 1 if i != j and new_graph.list2[i][j] == 0 else 0
-        new_graph.set_state(state)
-        new_graph.set_name(f'{new_graph.name}_addition')
-        return new_graph
+    def start_recording(self) -> None:
+        self.__mutations__ = []
 
-    def union(self, other):
-        new_graph = copy.deepcopy(self)
-        new_graph_state, other_state = new_graph.state, other.state
-        new_graph.set_state(Graph.State.INCIDENCE_MATRIX)
-        other.set_state(Graph.State.INCIDENCE_MATRIX)
-        n1, n2 = len(self.vertices()), len(other.vertices())
-        n_e1, n_e2 = self.edges_number(), other.edges_number()
-        for i in range(n1):
-            for j in range(n_e2):
-                new_graph.list2[i].append(0)
-        for i in range(n2):
-            new_graph.list2.append([0] * (n_e1 + n_e2))
-        for i in range(n2):
-            for j in range(n_e2):
-                new_graph.list2[i + n1][j + n_e1] = other.list2[i][j]
-        new_graph.set_state(new_graph_state)
-        other.set_state(other_state)
-        new_graph.set_name(f'{self.name}_union_{other.name}')
-        return new_graph
+    def take_mutations(self) -> list:
+        mutations = self.__mutations__ or []
+        if self.__mutations__ is not None:
+            self.__mutations__ = []
+        return mutations
 
-    def connection(self, other):
-        new_graph = self.union(other)
-        n1, n2 = len(self.vertices()), len(other.vertices())
-        n_e1, n_e2 = self.edges_number(), other.edges_number()
-        for i in range(n1):
-            for j in range(n_e2):
-                new_graph.list2[i][j + n_e1] = 1
-        for i in range(n2):
-            for j in range(n_e1):
-                new_graph.list2[i + n1][j] = 1
-        new_graph.set_name(f'{self.name}_connection_{other.name}')
-        return new_graph
+    def __record__(self, method_name: str, *args) -> None:
+        if self.__mutations__ is not None:
+            self.__mutations__.append((method_name, args))
 
-    def set_state(self, state: State) -> None:
-        if self.state == state:
+    def start_journal(self) -> None:
+        if self.__undo__ is None:
+            self.__undo__, self.__redo__ = [], []
+
+    def can_undo(self) -> bool:
+        return bool(self.__undo__)
+
+    def can_redo(self) -> bool:
+        return bool(self.__redo__)
+
+    def undo(self) -> bool:
+        if not self.__undo__:
+            return False
+        operation, inverse_operations = self.__undo__.pop()
+        self.__replay__(inverse_operations)
+        self.__redo__.append((operation, inverse_operations))
+        return True
+
+    def redo(self) -> bool:
+        if not self.__redo__:
+            return False
+        operation, inverse_operations = self.__redo__.pop()
+        self.__replay__([operation])
+        self.__undo__.append((operation, inverse_operations))
+        return True
+
+    def __replay__(self, operations: list) -> None:
+        undo, self.__undo__ = self.__undo__, None
+        try:
+            for method_name, args in operations:
+                getattr(self, method_name)(*args)
+        finally:
+            self.__undo__ = undo
+
+    def __push_journal__(self, operation: tuple, inverse_operations: list) -> None:
+        if len(inverse_operations) == 0:
             return
+        self.__undo__.append((operation, inverse_operations))
+        del self.__undo__[:-Graph.__journal_size__]
+        self.__redo__.clear()
+
+    def __restore_vertices_operations__(self, vertices: list) -> list:
+        restored = set(vertices)
+        operations = [('add_vertex', (v,)) for v in sorted(restored)]
+        for v in sorted(restored):
+            operations += restore_arcs_operations(v, *self.__neighborhood__(v), restored)
+        return operations
+
+    def __separate_vertices_operations__(self, i: int, j: int) -> list:
+        successors_i, predecessors_i = self.__neighborhood__(i)
+        successors_j, predecessors_j = self.__neighborhood__(j)
+        operations = [('add_vertex', (j,))]
+        operations += [('remove_directed_edge', ((i, k),)) for k in successors_j
+                       if k != i and k != j and k not in successors_i]
+        operations += [('remove_directed_edge', ((k, i),)) for k in predecessors_j
+                       if k != i and k != j and k not in predecessors_i]
+        loop, merged_loop = successors_i.get(i, 0), min(1, successors_i.get(j, 0)) + min(1, successors_j.get(i, 0))
+        operations += [('remove_directed_edge', ((i, i),))] * (merged_loop - loop)
+        operations += [('add_directed_edge', ((i, i),))] * (loop - merged_loop)
+        return operations + restore_arcs_operations(j, successors_j, predecessors_j, {j})
+
+    @property
+    def list2(self) -> list:
+        return self.__view__(self.state)
+
+    @list2.setter
+    def list2(self, list2: list) -> None:
+        self.__version__ += 1
+        self.__batch__ = None
+        self.__in_degrees__ = None
+        self.__out_degrees__ = None
+        self.__successors__ = None
+        self.__predecessors__ = None
+        if self.__undo__ is not None:
+            self.__undo__, self.__redo__ = [], []
+        self.__views__[self.state] = list2
+        self.__dirty__[self.state] = False
+        self.__mark_dirty_except__(self.state)
+
+    def lines(self, rows: slice = slice(None), columns: slice = slice(None)):
+        state_to_wrapper_lines = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_to_wrapper_lines,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_to_wrapper_lines,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_to_wrapper_lines,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_to_wrapper_lines,
+            Graph.State.BITSET_ADJACENCY: adjacency_matrix_to_wrapper_lines
+        }
+        yield f"Graph: '{self.name}'"
+        yield from state_to_wrapper_lines[self.state](self.list2, rows, columns)
+
+    @profiling.profiled
+    def __str__(self):
+        return self.__memoized__(('str', self.state, self.name), lambda: '\r\n'.join(self.lines()))
+
+    def version(self) -> int:
+        return self.__version__
+
+    def __memoized__(self, key: tuple, function):
+        if self.__memo_version__ != self.__version__:
+            self.__memo__ = {}
+            self.__memo_version__ = self.__version__
+        if key in self.__memo__:
+            self.__memo__[key] = self.__memo__.pop(key)
+        else:
+            if len(self.__memo__) == Graph.__memo_size__:
+                del self.__memo__[next(iter(self.__memo__))]
+            self.__memo__[key] = function()
+        return self.__memo__[key]
+
+    @staticmethod
+    def __list2_changer__(old_state: State, new_state: State):
         list2_changers = {
             Graph.State.ADJACENCY_LIST: {
                 Graph.State.ADJACENCY_MATRIX: adjacency_list_to_adjacency_matrix,
-                Graph.State.INCIDENCE_MATRIX: adjacency_list_to_incidence_matrix
+                Graph.State.INCIDENCE_MATRIX: adjacency_list_to_incidence_matrix,
+                Graph.State.SPARSE_INCIDENCE: adjacency_list_to_sparse_incidence_matrix,
+                Graph.State.BITSET_ADJACENCY: adjacency_list_to_bitset_adjacency_matrix
             },
             Graph.State.ADJACENCY_MATRIX: {
                 Graph.State.ADJACENCY_LIST: adjacency_matrix_to_adjacency_list,
-                Graph.State.INCIDENCE_MATRIX: adjacency_matrix_to_incidence_matrix
+                Graph.State.INCIDENCE_MATRIX: adjacency_matrix_to_incidence_matrix,
+                Graph.State.SPARSE_INCIDENCE: adjacency_matrix_to_sparse_incidence_matrix,
+                Graph.State.BITSET_ADJACENCY: adjacency_matrix_to_bitset_adjacency_matrix
             },
             Graph.State.INCIDENCE_MATRIX: {
                 Graph.State.ADJACENCY_LIST: incidence_matrix_to_adjacency_list,
-                Graph.State.ADJACENCY_MATRIX: incidence_matrix_to_adjacency_matrix
+                Graph.State.ADJACENCY_MATRIX: incidence_matrix_to_adjacency_matrix,
+                Graph.State.SPARSE_INCIDENCE: incidence_matrix_to_sparse_incidence_matrix,
+                Graph.State.BITSET_ADJACENCY: incidence_matrix_to_bitset_adjacency_matrix
+            },
+            Graph.State.SPARSE_INCIDENCE: {
+                Graph.State.ADJACENCY_LIST: sparse_incidence_matrix_to_adjacency_list,
+                Graph.State.ADJACENCY_MATRIX: sparse_incidence_matrix_to_adjacency_matrix,
+                Graph.State.INCIDENCE_MATRIX: sparse_incidence_matrix_to_incidence_matrix,
+                Graph.State.BITSET_ADJACENCY: sparse_incidence_matrix_to_bitset_adjacency_matrix
+            },
+            Graph.State.BITSET_ADJACENCY: {
+                Graph.State.ADJACENCY_LIST: bitset_adjacency_matrix_to_adjacency_list,
+                Graph.State.ADJACENCY_MATRIX: bitset_adjacency_matrix_to_adjacency_matrix,
+                Graph.State.INCIDENCE_MATRIX: bitset_adjacency_matrix_to_incidence_matrix,
+                Graph.State.SPARSE_INCIDENCE: bitset_adjacency_matrix_to_sparse_incidence_matrix
             }
         }
-        list2_changer = list2_changers[self.state][state]
-        self.list2 = list2_changer(self.list2)
+        return list2_changers[old_state][new_state]
+
+    def __clean_state__(self) -> State:
+        self.__commit_batch__()
+        if not self.__dirty__[self.state]:
+            return self.state
+        if not self.__dirty__[Graph.State.ADJACENCY_LIST]:
+            return Graph.State.ADJACENCY_LIST
+        return next(state for state in Graph.State if not self.__dirty__[state])
+
+    def __view__(self, state: State) -> list:
+        self.__commit_batch__()
+        if self.__dirty__[state]:
+            clean_state = self.__clean_state__()
+            list2_changer = Graph.__list2_changer__(clean_state, state)
+            self.__views__[state] = profiling.call(f'convert {clean_state.name.lower()}->{state.name.lower()}',
+                                                   list2_changer, self.__views__[clean_state])
+            self.__dirty__[state] = False
+        return self.__views__[state]
+
+    def __mutable_view__(self, state: State) -> list:
+        list2 = self.__view__(state)
+        if isinstance(list2, MappedList2):
+            list2 = list2.materialize()
+            if numpy_backend.is_enabled() and state == Graph.State.ADJACENCY_MATRIX:
+                list2 = numpy_backend.to_adjacency_array(list2)
+            self.__views__[state] = list2
+        return list2
+
+    def close(self) -> None:
+        for state in Graph.State:
+            list2 = self.__views__[state]
+            if isinstance(list2, MappedList2):
+                self.__mutable_view__(state)
+            if isinstance(list2, (MappedList2, SparseIncidenceMatrix)):
+                list2.close()
+
+    def __mark_dirty_except__(self, state: State) -> None:
+        for other_state in Graph.State:
+            if other_state != state:
+                self.__views__[other_state] = None
+                self.__dirty__[other_state] = True
+
+    @contextmanager
+    def batch(self):
+        self.__batch_depth__ += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth__ -= 1
+            if self.__batch_depth__ == 0:
+                self.__commit_batch__()
+
+    def __batch_counts__(self) -> list:
+        if self.__batch__ is None:
+            state_to_adjacency_counts = {
+                Graph.State.ADJACENCY_LIST: adjacency_list_to_adjacency_counts,
+                Graph.State.ADJACENCY_MATRIX: adjacency_matrix_to_adjacency_counts,
+                Graph.State.INCIDENCE_MATRIX: incidence_matrix_to_adjacency_counts,
+                Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_to_adjacency_counts,
+                Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_to_adjacency_counts
+            }
+            state = self.__clean_state__()
+            self.__batch__ = profiling.call(f'convert {state.name.lower()}->adjacency_counts',
+                                            state_to_adjacency_counts[state], self.__views__[state])
+            for state in Graph.State:
+                self.__views__[state] = None
+                self.__dirty__[state] = True
+        return self.__batch__
+
+    def __commit_batch__(self) -> None:
+        if self.__batch__ is None:
+            return
+        adjacency_counts_to_state = {
+            Graph.State.ADJACENCY_LIST: adjacency_counts_to_adjacency_list,
+            Graph.State.ADJACENCY_MATRIX: adjacency_counts_to_adjacency_matrix,
+            Graph.State.INCIDENCE_MATRIX: adjacency_counts_to_incidence_matrix,
+            Graph.State.SPARSE_INCIDENCE: adjacency_counts_to_sparse_incidence_matrix,
+            Graph.State.BITSET_ADJACENCY: BitsetAdjacencyMatrix.from_adjacency_counts
+        }
+        adjacency_counts, self.__batch__ = adjacency_counts_sorted(self.__batch__), None
+        self.__views__[self.state] = profiling.call(f'convert adjacency_counts->{self.state.name.lower()}',
+                                                    adjacency_counts_to_state[self.state], adjacency_counts)
+        self.__dirty__[self.state] = False
+
+    @profiling.profiled
+    def edges_number(self) -> int:
+        return self.__memoized__(('edges_number',), self.__edges_number__)
+
+    def __edges_number__(self) -> int:
+        self.__commit_batch__()
+        for state in Graph.State:
+            list2 = self.__views__[state]
+            if not self.__dirty__[state] and isinstance(list2, (MappedList2, SparseIncidenceMatrix, BitsetAdjacencyMatrix)):
+                return list2.edges_number()
+        if not self.__dirty__[Graph.State.INCIDENCE_MATRIX]:
+            incidence_matrix = self.__views__[Graph.State.INCIDENCE_MATRIX]
+            return len(incidence_matrix[0]) if len(incidence_matrix) != 0 else 0
+        return self.__view__(Graph.State.SPARSE_INCIDENCE).edges_number()
+
+    @staticmethod
+    @profiling.profiled
+    def addition(graph):
+        return AdditionView(graph)
+
+    @profiling.profiled
+    def union(self, other):
+        return UnionView(self, other)
+
+    @profiling.profiled
+    def connection(self, other):
+        return ConnectionView(self, other)
+
+    @profiling.profiled
+    def intersection(self, other):
+        return IntersectionView(self, other)
+
+    @profiling.profiled
+    def symmetric_difference(self, other):
+        return SymmetricDifferenceView(self, other)
+
+    @profiling.profiled
+    def contraction(self, i: int, j: int):
+        return ContractionView(self, i, j)
+
+    @profiling.profiled
+    def copy(self):
+        state = self.__clean_state__()
+        new_graph = Graph(list2_copy(self.__views__[state]), state, self.name)
+        for other_state in Graph.State:
+            if other_state != state and not self.__dirty__[other_state]:
+                new_graph.__views__[other_state] = list2_copy(self.__views__[other_state])
+                new_graph.__dirty__[other_state] = False
+        new_graph.set_state(self.state)
+        return new_graph
+
+    def __deepcopy__(self, memo: dict):
+        return self.copy()
+
+    def materialize(self):
+        return self
+
+    def __count_consumers__(self, consumers_numbers: dict) -> None:
+        pass
+
+    def __materialize__(self, results: dict, consumers_numbers: dict):
+        return self
+
+    def __adjacency_counts__(self) -> list:
+        return adjacency_list_to_adjacency_counts(self.__view__(Graph.State.ADJACENCY_LIST))
+
+    def __adjacency_list__(self) -> list:
+        return self.__view__(Graph.State.ADJACENCY_LIST)
+
+    def __incidence_column_heads__(self):
+        if not self.__dirty__[Graph.State.INCIDENCE_MATRIX]:
+            incidence_columns = incidence_matrix_to_incidence_columns(self.__views__[Graph.State.INCIDENCE_MATRIX])
+        else:
+            incidence_columns = self.__view__(Graph.State.SPARSE_INCIDENCE).columns()
+        return (tuple(column[:2]) for column in incidence_columns)
+
+    @journaled
+    def set_state(self, state: State) -> None:
+        self.__record__('set_state', state)
+        if self.__journal_group__ is not None and state != self.state:
+            self.__journal_group__.append([('set_state', (self.state,))])
         self.state = state
 
+    @journaled
     def set_name(self, name: str) -> None:
+        self.__record__('set_name', name)
+        if self.__journal_group__ is not None and name != self.name:
+            self.__journal_group__.append([('set_name', (self.name,))])
         self.name = 'unnamed' if str == '' else name
 
+    @profiling.profiled
     def vertices(self) -> list:
-        return list(range(len(self.list2)))
+        return list(range(len(self.__views__[self.__clean_state__()])))
 
+    def arcs(self):
+        state_to_arcs = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_arcs,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_arcs,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_arcs,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_arcs,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_arcs
+        }
+        state = self.__clean_state__()
+        return state_to_arcs[state](self.__views__[state])
+
+    @profiling.profiled
     def directed_edges(self) -> list:
-        state = self.state
-        self.set_state(Graph.State.ADJACENCY_LIST)
-        result = [(u, v) for u, adjacency in enumerate(self.list2) for v in adjacency]
-        self.set_state(state)
-        return result
+        return self.__memoized__(('directed_edges',), self.__directed_edges__)
+
+    def __directed_edges__(self) -> list:
+        adjacency_list = self.__view__(Graph.State.ADJACENCY_LIST)
+        return [(u, v) for u, adjacency in enumerate(adjacency_list) for v in adjacency]
 
+    def __degrees__(self) -> tuple:
+        if self.__in_degrees__ is None:
+            self.__in_degrees__, self.__out_degrees__ = adjacency_list_degrees(self.__view__(Graph.State.ADJACENCY_LIST))
+        return self.__in_degrees__, self.__out_degrees__
+
+    def in_degree(self, v: int) -> int:
+        return self.__degrees__()[0][v]
+
+    def out_degree(self, v: int) -> int:
+        return self.__degrees__()[1][v]
+
+    @profiling.profiled
+    def degree_sequence(self) -> list:
+        return self.__memoized__(('degree_sequence',), lambda: list(zip(*self.__degrees__())))
+
+    def __neighbor_index__(self) -> tuple:
+        if self.__successors__ is None:
+            self.__successors__, self.__predecessors__ = adjacency_list_neighbor_index(self.__view__(Graph.State.ADJACENCY_LIST))
+        return self.__successors__, self.__predecessors__
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return v in self.__neighbor_index__()[0][u]
+
+    def successors(self, v: int) -> list:
+        return sorted(self.__neighbor_index__()[0][v])
+
+    def predecessors(self, v: int) -> list:
+        return sorted(self.__neighbor_index__()[1][v])
+
+    @profiling.profiled
+    def degrees_fingerprint(self) -> str:
+        return self.__memoized__(('degrees_fingerprint',), lambda: degrees_fingerprint(*self.__degrees__()))
+
+    @profiling.profiled
+    def fingerprint(self) -> str:
+        return self.__memoized__(('fingerprint',), lambda: neighbor_index_fingerprint(*self.__neighbor_index__()))
+
+    def __set_neighbor_index__(self, i: int, j: int, count: int) -> None:
+        if self.__successors__ is None:
+            return
+        if count == 0:
+            self.__successors__[i].pop(j, None)
+            self.__predecessors__[j].pop(i, None)
+        else:
+            self.__successors__[i][j] = count
+            self.__predecessors__[j][i] = count
+
+    def __neighborhood__(self, v: int) -> tuple:
+        if self.__batch__ is not None:
+            return adjacency_counts_neighborhood(self.__batch__, v)
+        neighborhood_getters = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_neighborhood,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_neighborhood,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_neighborhood,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_neighborhood,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_neighborhood
+        }
+        state = self.__clean_state__()
+        return neighborhood_getters[state](self.__views__[state], v)
+
+    def __shift_degrees__(self, vertices: set, successors: dict, predecessors: dict, sign: int) -> None:
+        for w, count in successors.items():
+            if w not in vertices:
+                self.__in_degrees__[w] += sign * count
+        for u, count in predecessors.items():
+            if u not in vertices:
+                self.__out_degrees__[u] += sign * count
+
+    def __remove_degrees__(self, vertices: list) -> None:
+        for v in vertices:
+            self.__shift_degrees__(set(vertices), *self.__neighborhood__(v), -1)
+        for v in sorted(vertices, reverse=True):
+            del self.__in_degrees__[v]
+            del self.__out_degrees__[v]
+
+    def __reset_degrees__(self, v: int) -> None:
+        successors, predecessors = self.__neighborhood__(v)
+        self.__shift_degrees__({v}, successors, predecessors, 1)
+        self.__in_degrees__[v] = sum(predecessors.values())
+        self.__out_degrees__[v] = sum(successors.values())
+
+    def __add_directed_edge_degrees__(self, i: int, j: int, delta: int) -> None:
+        self.__out_degrees__[i] += delta
+        self.__in_degrees__[j] += delta
+
+    def __directed_edge_multiplicity__(self, i: int, j: int) -> int:
+        if self.__successors__ is not None:
+            return self.__successors__[i].get(j, 0)
+        if self.__batch__ is None and not self.__dirty__[Graph.State.ADJACENCY_MATRIX]:
+            return int(self.__views__[Graph.State.ADJACENCY_MATRIX][i][j])
+        if self.__batch__ is None and not self.__dirty__[Graph.State.BITSET_ADJACENCY]:
+            return self.__views__[Graph.State.BITSET_ADJACENCY].multiplicity(i, j)
+        if self.__batch__ is None and not self.__dirty__[Graph.State.ADJACENCY_LIST]:
+            return sum(1 for w in self.__views__[Graph.State.ADJACENCY_LIST][i] if w == j)
+        return self.__batch_counts__()[i].get(j, 0)
+
+    def __apply_mutator__(self, mutators: dict, adjacency_counts_mutator, *args) -> None:
+        self.__version__ += 1
+        if self.__batch_depth__ == 0 and self.__batch__ is None:
+            state = self.__clean_state__()
+            if state not in mutators:
+                state = next((state for state in mutators if not self.__dirty__[state]), None)
+            if state is not None:
+                self.__views__[state] = mutators[state](self.__mutable_view__(state), *args)
+                self.__mark_dirty_except__(state)
+                return
+        adjacency_counts_mutator(self.__batch_counts__(), *args)
+
+    @profiling.profiled
+    @journaled
     def identify_vertices(self, i, j) -> None:
         if i == j:
             return
-        state = self.state
-        self.set_state(Graph.State.ADJACENCY_MATRIX)
-        list2 = self.list2
-        for k in range(len(list2)):
-            if k != i and k != j:
-                if list2[j][k] == 1:
-                    list2[i][k] = 1
-                if list2[k][j] == 1:
-                    list2[k][i] = 1
-        if list2[i][j] == list2[j][i] == 1:
-            list2[i][i] = 2
-        elif list2[i][j] == 1 or list2[j][i] == 1:
-            list2[i][i] = 1
-        else:
-            list2[i][i] = 0
-        for k in range(len(list2)):
-            list2[k][j] = 0
-            list2[j][k] = 0
-        self.set_state(Graph.State.INCIDENCE_MATRIX)
-        del self.list2[j]
-        self.set_state(state)
+        self.__record__('identify_vertices', i, j)
+        if self.__journal_group__ is not None:
+            self.__journal_group__.append(self.__separate_vertices_operations__(i, j))
+        self.__successors__ = self.__predecessors__ = None
+        vertices_identifiers = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_identify_vertices,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_identify_vertices,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_identify_vertices,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_identify_vertices,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_identify_vertices
+        }
+        if self.__in_degrees__ is None:
+            self.__apply_mutator__(vertices_identifiers, adjacency_counts_identify_vertices, i, j)
+            return
+        self.__remove_degrees__([i, j])
+        self.__in_degrees__.insert(i - (j < i), 0)
+        self.__out_degrees__.insert(i - (j < i), 0)
+        self.__apply_mutator__(vertices_identifiers, adjacency_counts_identify_vertices, i, j)
+        self.__reset_degrees__(i - (j < i))
 
+    @profiling.profiled
+    @journaled
     def add_vertex(self, v: int) -> None:
-        state = self.state
-        self.set_state(Graph.State.INCIDENCE_MATRIX)
-        self.list2.insert(v, [0] * len(self.list2[0]))
-        self.set_state(state)
+        self.__record__('add_vertex', v)
+        if self.__journal_group__ is not None:
+            self.__journal_group__.append([('remove_vertex', (v,))])
+        self.__successors__ = self.__predecessors__ = None
+        vertex_adders = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_add_vertex,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_add_vertex,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_add_vertex,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_add_vertex,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_add_vertex
+        }
+        if self.__in_degrees__ is not None:
+            self.__in_degrees__.insert(v, 0)
+            self.__out_degrees__.insert(v, 0)
+        self.__apply_mutator__(vertex_adders, adjacency_counts_add_vertex, v)
 
+    @profiling.profiled
+    @journaled
     def remove_vertex(self, v: int) -> None:
-        state = self.state
-        self.set_state(Graph.State.ADJACENCY_MATRIX)
-        for i in range(len(self.list2)):
-            self.list2[i][v] = 0
-            self.list2[v][i] = 0
-        self.set_state(Graph.State.INCIDENCE_MATRIX)
-        del self.list2[v]
-        self.set_state(state)
+        self.__record__('remove_vertex', v)
+        if self.__journal_group__ is not None:
+            self.__journal_group__.append(self.__restore_vertices_operations__([v]))
+        self.__successors__ = self.__predecessors__ = None
+        vertex_removers = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_remove_vertex,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_remove_vertex,
+            Graph.State.INCIDENCE_MATRIX: incidence_matrix_remove_vertex,
+            Graph.State.SPARSE_INCIDENCE: sparse_incidence_matrix_remove_vertex,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_remove_vertex
+        }
+        if self.__in_degrees__ is not None:
+            self.__remove_degrees__([v])
+        self.__apply_mutator__(vertex_removers, adjacency_counts_remove_vertex, v)
+
+    @profiling.profiled
+    @journaled
+    def remove_vertices(self, vertices: list) -> None:
+        vertices = list(vertices)
+        self.__record__('remove_vertices', vertices)
+        if self.__journal_group__ is not None:
+            self.__journal_group__.append(self.__restore_vertices_operations__(vertices))
+        self.__successors__ = self.__predecessors__ = None
+        self.__version__ += 1
+        with self.batch():
+            adjacency_counts_remove_vertices(self.__batch_counts__(), vertices)
+            if self.__in_degrees__ is not None:
+                self.__in_degrees__, self.__out_degrees__ = adjacency_counts_degrees(self.__batch_counts__())
 
+    @journaled
     def pull_of_edge(self, e: tuple) -> None:
         i, j = e
         self.identify_vertices(i, j)
 
+    @profiling.profiled
+    @journaled
     def add_directed_edge(self, e: tuple) -> None:
-        state = self.state
-        self.set_state(Graph.State.ADJACENCY_MATRIX)
-        i, j = e
-        if i == j:
-            self.list2[i][i] = min(2, self.list2[i][i] + 1)
-        elif self.list2[i][j] == 0:
-            self.list2[i][j] = 1
-        self.set_state(state)
+        self.__record__('add_directed_edge', e)
+        if self.__in_degrees__ is not None or self.__successors__ is not None or self.__journal_group__ is not None:
+            count = self.__directed_edge_multiplicity__(*e)
+            new_count = min(2, count + 1) if e[0] == e[1] else max(1, count)
+            if self.__in_degrees__ is not None:
+                self.__add_directed_edge_degrees__(*e, new_count - count)
+            self.__set_neighbor_index__(*e, new_count)
+            if self.__journal_group__ is not None:
+                self.__journal_group__.append([('remove_directed_edge', (e,))] * (new_count - count))
+        directed_edge_adders = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_add_directed_edge,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_add_directed_edge,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_add_directed_edge
+        }
+        self.__apply_mutator__(directed_edge_adders, adjacency_counts_add_directed_edge, *e)
+
+    @profiling.profiled
+    @journaled
+    def add_directed_edges(self, edges: list) -> None:
+        edges = list(edges)
+        with self.batch():
+            for e in edges:
+                self.add_directed_edge(e)
 
+    @profiling.profiled
+    @journaled
     def remove_directed_edge(self, e: tuple) -> None:
-        state = self.state
-        self.set_state(Graph.State.ADJACENCY_MATRIX)
-        i, j = e
-        if self.list2[i][j] in [1, 2]:
-            self.list2[i][j] -= 1
-        self.set_state(state)
+        self.__record__('remove_directed_edge', e)
+        if self.__in_degrees__ is not None or self.__successors__ is not None or self.__journal_group__ is not None:
+            count = self.__directed_edge_multiplicity__(*e)
+            new_count = count - 1 if count in [1, 2] else count
+            if self.__in_degrees__ is not None:
+                self.__add_directed_edge_degrees__(*e, new_count - count)
+            self.__set_neighbor_index__(*e, new_count)
+            if self.__journal_group__ is not None:
+                self.__journal_group__.append([('add_directed_edge', (e,))] * (count - new_count))
+        directed_edge_removers = {
+            Graph.State.ADJACENCY_LIST: adjacency_list_remove_directed_edge,
+            Graph.State.ADJACENCY_MATRIX: adjacency_matrix_remove_directed_edge,
+            Graph.State.BITSET_ADJACENCY: bitset_adjacency_matrix_remove_directed_edge
+        }
+        self.__apply_mutator__(directed_edge_removers, adjacency_counts_remove_directed_edge, *e)
+
+    @profiling.profiled
+    @journaled
+    def remove_directed_edges(self, edges: list) -> None:
+        edges = list(edges)
+        with self.batch():
+            for e in edges:
+                self.remove_directed_edge(e)
+
+
+class GraphView:
+    def __init__(self, name: str, state: Graph.State):
+        self.name = name
+        self.state = state
+
+    def set_state(self, state: Graph.State) -> None:
+        self.state = state
+
+    def set_name(self, name: str) -> None:
+        self.name = name
+
+    def operands(self) -> tuple:
+        raise NotImplementedError
+
+    def vertices(self) -> list:
+        raise NotImplementedError
+
+    def edges_number(self) -> int:
+        return self.materialize().edges_number()
+
+    def __adjacency_counts__(self) -> list:
+        raise NotImplementedError
+
+    def __incidence_column_heads__(self):
+        return iter(adjacency_counts_to_incidence_columns(self.__adjacency_counts__()))
+
+    def __adjacency_list__(self) -> list:
+        return adjacency_counts_to_adjacency_list(self.__adjacency_counts__())
+
+    @profiling.profiled
+    def materialize(self) -> Graph:
+        consumers_numbers = {}
+        self.__count_consumers__(consumers_numbers)
+        return self.__materialize__({}, consumers_numbers)
+
+    def __count_consumers__(self, consumers_numbers: dict) -> None:
+        for operand in self.operands():
+            consumers_numbers[id(operand)] = consumers_numbers.get(id(operand), 0) + 1
+            if consumers_numbers[id(operand)] == 1:
+                operand.__count_consumers__(consumers_numbers)
+
+    def __materialize__(self, results: dict, consumers_numbers: dict) -> Graph:
+        if id(self) not in results:
+            new_graph = self.__build__(results, consumers_numbers)
+            new_graph.set_state(self.state)
+            new_graph.set_name(self.name)
+            results[id(self)] = new_graph
+        return results[id(self)]
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        raise NotImplementedError
+
+    @staticmethod
+    def cheapest_state(graphs: list, states: list) -> Graph.State:
+        for graph in graphs:
+            graph.__commit_batch__()
+        return next((state for state in states if all(not graph.__dirty__[state] for graph in graphs)), states[-1])
+
+    def degree_sequence(self) -> list:
+        return list(zip(*adjacency_counts_degrees(self.__adjacency_counts__())))
+
+    def in_degree(self, v: int) -> int:
+        return self.degree_sequence()[v][0]
+
+    def out_degree(self, v: int) -> int:
+        return self.degree_sequence()[v][1]
+
+    def directed_edges(self) -> list:
+        return [(u, v) for u, counts in enumerate(self.__adjacency_counts__()) for v, count in counts.items()
+                for _ in range(count)]
+
+    @staticmethod
+    def addition(graph):
+        return AdditionView(graph)
+
+    def union(self, other):
+        return UnionView(self, other)
+
+    def connection(self, other):
+        return ConnectionView(self, other)
+
+    def intersection(self, other):
+        return IntersectionView(self, other)
+
+    def symmetric_difference(self, other):
+        return SymmetricDifferenceView(self, other)
+
+    def contraction(self, i: int, j: int):
+        return ContractionView(self, i, j)
+
+    def __str__(self):
+        return str(self.materialize())
+
+
+class AdditionView(GraphView):
+    def __init__(self, graph):
+        super().__init__(f'{graph.name}_addition', graph.state)
+        self.graph = graph
+
+    def operands(self) -> tuple:
+        return self.graph,
+
+    def vertices(self) -> list:
+        return self.graph.vertices()
+
+    def edges_number(self) -> int:
+        adjacency_counts = self.graph.__adjacency_counts__()
+        n = len(adjacency_counts)
+        symmetric_pairs_number = sum(1 for u, counts in enumerate(adjacency_counts) for v in counts
+                                     if u < v and u in adjacency_counts[v])
+        return n * (n - 1) // 2 - symmetric_pairs_number
+
+    def __adjacency_counts__(self) -> list:
+        adjacency_counts = self.graph.__adjacency_counts__()
+        return [{v: 1 for v in range(len(adjacency_counts)) if v != u and v not in counts}
+                for u, counts in enumerate(adjacency_counts)]
+
+    def degree_sequence(self) -> list:
+        adjacency_counts = self.graph.__adjacency_counts__()
+        n = len(adjacency_counts)
+        in_degrees, out_degrees = [n - 1] * n, [n - 1] * n
+        for u, counts in enumerate(adjacency_counts):
+            for v in counts:
+                if u != v:
+                    out_degrees[u] -= 1
+                    in_degrees[v] -= 1
+        return list(zip(in_degrees, out_degrees))
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        if isinstance(self.graph, UnionView) and id(self.graph) not in results and consumers_numbers[id(self.graph)] == 1:
+            graph1 = self.graph.graph1.__materialize__(results, consumers_numbers)
+            graph2 = self.graph.graph2.__materialize__(results, consumers_numbers)
+            return Graph(adjacency_matrices_union_addition(graph1.__view__(Graph.State.ADJACENCY_MATRIX),
+                                                           graph2.__view__(Graph.State.ADJACENCY_MATRIX)),
+                         Graph.State.ADJACENCY_MATRIX)
+        graph = self.graph.__materialize__(results, consumers_numbers)
+        state = GraphView.cheapest_state([graph], [Graph.State.BITSET_ADJACENCY, Graph.State.ADJACENCY_MATRIX])
+        if state == Graph.State.BITSET_ADJACENCY:
+            return Graph(graph.__view__(Graph.State.BITSET_ADJACENCY).addition(), Graph.State.BITSET_ADJACENCY)
+        return Graph(adjacency_matrix_addition(graph.__view__(Graph.State.ADJACENCY_MATRIX)), Graph.State.ADJACENCY_MATRIX)
+
+
+class UnionView(GraphView):
+    def __init__(self, graph1, graph2):
+        super().__init__(f'{graph1.name}_union_{graph2.name}', graph1.state)
+        self.graph1 = graph1
+        self.graph2 = graph2
+
+    def operands(self) -> tuple:
+        return self.graph1, self.graph2
+
+    def vertices(self) -> list:
+        return list(range(len(self.graph1.vertices()) + len(self.graph2.vertices())))
+
+    def edges_number(self) -> int:
+        if numpy_backend.is_enabled() and self.state == Graph.State.ADJACENCY_MATRIX:
+            return sum(len(adjacency_counts_to_incidence_columns(graph.__adjacency_counts__()))
+                       for graph in [self.graph1, self.graph2])
+        return self.graph1.edges_number() + self.graph2.edges_number()
+
+    def __adjacency_counts__(self) -> list:
+        adjacency_counts = self.graph1.__adjacency_counts__()
+        n1 = len(adjacency_counts)
+        adjacency_counts.extend({n1 + v: count for v, count in counts.items()}
+                                for counts in self.graph2.__adjacency_counts__())
+        return adjacency_counts
+
+    def __incidence_column_heads__(self):
+        n1 = len(self.graph1.vertices())
+        return chain(self.graph1.__incidence_column_heads__(),
+                     (tuple((n1 + i, degree) for i, degree in head) for head in self.graph2.__incidence_column_heads__()))
+
+    def degree_sequence(self) -> list:
+        return self.graph1.degree_sequence() + self.graph2.degree_sequence()
+
+    def directed_edges(self) -> list:
+        n1 = len(self.graph1.vertices())
+        return self.graph1.directed_edges() + [(n1 + u, n1 + v) for u, v in self.graph2.directed_edges()]
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        graph1 = self.graph1.__materialize__(results, consumers_numbers)
+        graph2 = self.graph2.__materialize__(results, consumers_numbers)
+        if numpy_backend.is_enabled() and self.state == Graph.State.ADJACENCY_MATRIX:
+            adjacency_matrix = graph1.__view__(Graph.State.ADJACENCY_MATRIX)
+            return Graph(numpy_backend.union(adjacency_matrix, graph2.__view__(Graph.State.ADJACENCY_MATRIX)),
+                         Graph.State.ADJACENCY_MATRIX)
+        state = GraphView.cheapest_state([graph1, graph2], [Graph.State.ADJACENCY_LIST, Graph.State.SPARSE_INCIDENCE])
+        if state == Graph.State.ADJACENCY_LIST:
+            return Graph(adjacency_lists_union(graph1.__view__(Graph.State.ADJACENCY_LIST),
+                                               graph2.__view__(Graph.State.ADJACENCY_LIST)), Graph.State.ADJACENCY_LIST)
+        sparse_incidence_matrix = graph1.__view__(Graph.State.SPARSE_INCIDENCE)
+        return Graph(sparse_incidence_matrix.union(graph2.__view__(Graph.State.SPARSE_INCIDENCE)),
+                     Graph.State.SPARSE_INCIDENCE)
+
+
+class ConnectionView(GraphView):
+    def __init__(self, graph1, graph2):
+        super().__init__(f'{graph1.name}_connection_{graph2.name}', graph1.state)
+        self.graph1 = graph1
+        self.graph2 = graph2
+
+    def operands(self) -> tuple:
+        return self.graph1, self.graph2
+
+    def vertices(self) -> list:
+        return list(range(len(self.graph1.vertices()) + len(self.graph2.vertices())))
+
+    def edges_number(self) -> int:
+        return len(adjacency_counts_to_incidence_columns(self.__adjacency_counts__()))
+
+    @staticmethod
+    def connection_column_heads(graph1, graph2):
+        n1, n2 = len(graph1.vertices()), len(graph2.vertices())
+        first_tails = tuple((n1 + i, 1) for i in range(min(n2, 2)))
+        second_heads = tuple((i, 1) for i in range(min(n1, 2)))
+        return chain((head + first_tails[:2 - len(head)] for head in graph1.__incidence_column_heads__()),
+                     ((second_heads + tuple((n1 + i, degree) for i, degree in head))[:2]
+                      for head in graph2.__incidence_column_heads__()))
+
+    def __incidence_column_heads__(self):
+        return ConnectionView.connection_column_heads(self.graph1, self.graph2)
+
+    def __adjacency_counts__(self) -> list:
+        return incidence_columns_to_adjacency_counts(len(self.vertices()), self.__incidence_column_heads__())
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        graph1 = self.graph1.__materialize__(results, consumers_numbers)
+        graph2 = self.graph2.__materialize__(results, consumers_numbers)
+        adjacency_counts = incidence_columns_to_adjacency_counts(len(graph1.vertices()) + len(graph2.vertices()),
+                                                                 ConnectionView.connection_column_heads(graph1, graph2))
+        return Graph(adjacency_counts_to_sparse_incidence_matrix(adjacency_counts), Graph.State.SPARSE_INCIDENCE)
+
+
+class ContractionView(GraphView):
+    def __init__(self, graph, i: int, j: int):
+        super().__init__(f'{graph.name}_contraction', graph.state)
+        self.graph = graph
+        self.i = i
+        self.j = j
+
+    def operands(self) -> tuple:
+        return self.graph,
+
+    def vertices(self) -> list:
+        return self.graph.vertices()[:-1] if self.i != self.j else self.graph.vertices()
+
+    def edges_number(self) -> int:
+        return len(adjacency_counts_to_incidence_columns(self.__adjacency_counts__()))
+
+    def __adjacency_counts__(self) -> list:
+        adjacency_counts = self.graph.__adjacency_counts__()
+        if self.i != self.j:
+            adjacency_counts_identify_vertices(adjacency_counts, self.i, self.j)
+        return adjacency_counts
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        graph = self.graph.__materialize__(results, consumers_numbers)
+        if isinstance(self.graph, Graph) or consumers_numbers[id(self.graph)] > 1:
+            graph = graph.copy()
+        graph.identify_vertices(self.i, self.j)
+        return graph
+
+
+class IntersectionView(GraphView):
+    def __init__(self, graph1, graph2):
+        super().__init__(f'{graph1.name}_intersection_{graph2.name}', graph1.state)
+        self.graph1 = graph1
+        self.graph2 = graph2
+
+    def operands(self) -> tuple:
+        return self.graph1, self.graph2
+
+    def vertices(self) -> list:
+        return list(range(min(len(self.graph1.vertices()), len(self.graph2.vertices()))))
+
+    def edges_number(self) -> int:
+        return combined_adjacency_counts_edges_number(self.graph1.__adjacency_counts__(),
+                                                      self.graph2.__adjacency_counts__(), min)
+
+    def __adjacency_list__(self) -> list:
+        return adjacency_lists_intersection(self.graph1.__adjacency_list__(), self.graph2.__adjacency_list__())
+
+    def __adjacency_counts__(self) -> list:
+        return adjacency_list_to_adjacency_counts(self.__adjacency_list__())
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        graph1 = self.graph1.__materialize__(results, consumers_numbers)
+        graph2 = self.graph2.__materialize__(results, consumers_numbers)
+        return Graph(adjacency_lists_intersection(graph1.__adjacency_list__(), graph2.__adjacency_list__()),
+                     Graph.State.ADJACENCY_LIST)
+
+
+class SymmetricDifferenceView(GraphView):
+    def __init__(self, graph1, graph2):
+        super().__init__(f'{graph1.name}_symmetric_difference_{graph2.name}', graph1.state)
+        self.graph1 = graph1
+        self.graph2 = graph2
+
+    def operands(self) -> tuple:
+        return self.graph1, self.graph2
+
+    def vertices(self) -> list:
+        return list(range(max(len(self.graph1.vertices()), len(self.graph2.vertices()))))
+
+    def edges_number(self) -> int:
+        return combined_adjacency_counts_edges_number(self.graph1.__adjacency_counts__(),
+                                                      self.graph2.__adjacency_counts__(), lambda count1, count2: abs(count1 - count2))
+
+    def __adjacency_list__(self) -> list:
+        return adjacency_lists_symmetric_difference(self.graph1.__adjacency_list__(), self.graph2.__adjacency_list__())
+
+    def __adjacency_counts__(self) -> list:
+        return adjacency_list_to_adjacency_counts(self.__adjacency_list__())
+
+    def __build__(self, results: dict, consumers_numbers: dict) -> Graph:
+        graph1 = self.graph1.__materialize__(results, consumers_numbers)
+        graph2 = self.graph2.__materialize__(results, consumers_numbers)
+        return Graph(adjacency_lists_symmetric_difference(graph1.__adjacency_list__(), graph2.__adjacency_list__()),
+                     Graph.State.ADJACENCY_LIST)
@@ -0,0 +1,371 @@
+from array import array
+from bitset_adjacency import BitsetAdjacencyMatrix
+from graph import (adjacency_list_to_adjacency_matrix, Graph, incidence_columns_to_incidence_matrix)
+from mapped_list2 import (MappedAdjacencyList, MappedList2, MappedMatrix)
+from sparse_incidence import SparseIncidenceMatrix
+from contextlib import contextmanager
+import gzip
+import mmap
+import numpy_backend
+import os
+import struct
+import uuid
+import warnings
+
+__chunk_size__ = 1 << 20
+__binary_magic__ = b'GRPH'
+__binary_version__ = 1
+__binary_header__ = struct.Struct('<4sHBxqqI4x')
+__gzip_magic__ = b'\x1f\x8b'
+__number_bytes__ = {str(number).encode(): number & 0xff for number in range(-128, 128)}
+
+
+def open_text(filename: str):
+    with open(filename, 'rb') as file:
+        magic = file.read(len(__gzip_magic__))
+    return gzip.open(filename, 'rt') if magic == __gzip_magic__ else open(filename, 'r')
+
+
+def read_lines_chunks(filename: str, chunk_size: int = __chunk_size__):
+    with open_text(filename) as file:
+        rest = ''
+        while chunk := file.read(chunk_size):
+            lines, newline, rest = (rest + chunk).rpartition('\n')
+            if newline:
+                yield lines
+        if rest:
+            yield rest
+
+
+def check_width(filename: str, i: int, row: list, width: int) -> None:
+    if len(row) != width:
+        raise ValueError(f"'{filename}': row {i + 1} has {len(row)} numbers, expected {width}")
+
+
+def parse_matrix_row(filename: str, i: int, line: bytes, width: int) -> array:
+    numbers = line.split()
+    check_width(filename, i, numbers, width)
+    try:
+        return array('b', bytes(map(__number_bytes__.__getitem__, numbers)))
+    except KeyError:
+        pass
+    try:
+        return array('b', map(int, numbers))
+    except (ValueError, OverflowError) as error:
+        raise ValueError(f"'{filename}': row {i + 1}: {error}")
+
+
+def parse_matrix_block(filename: str, i: int, rows: list, width: int):
+    numpy = numpy_backend.numpy
+    for k, row in enumerate(rows):
+        check_width(filename, i + k, row.split(), width)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            values = numpy.fromstring('\n'.join(rows), dtype=numpy.int64, sep=' ')
+        if values.size == 0 or -128 <= values.min() and values.max() <= 127:
+            return values.astype(numpy.int8).reshape(len(rows), width)
+    except (ValueError, DeprecationWarning):
+        pass
+    for k, row in enumerate(rows):
+        parse_matrix_row(filename, i + k, row.encode(), width)
+    raise ValueError(f"'{filename}': rows {i + 1}-{i + len(rows)} could not be read as numbers")
+
+
+def read_matrix_blocks(filename: str, keep_empty_rows: bool = False):
+    width, i = None, 0
+    for lines in read_lines_chunks(filename):
+        rows = [line for line in lines.split('\n') if line.strip()]
+        if len(rows) == 0:
+            if not keep_empty_rows or width not in [None, 0]:
+                continue
+            width, rows_number = 0, lines.count('\n') + 1
+            if numpy_backend.is_enabled():
+                yield numpy_backend.numpy.zeros((rows_number, 0), dtype=numpy_backend.numpy.int8)
+            else:
+                yield [array('b') for _ in range(rows_number)]
+            i += rows_number
+            continue
+        if width is None:
+            width = len(rows[0].split())
+        if numpy_backend.is_enabled():
+            yield parse_matrix_block(filename, i, rows, width)
+        else:
+            yield [parse_matrix_row(filename, i + k, row.encode(), width) for k, row in enumerate(rows)]
+        i += len(rows)
+
+
+def read_adjacency_list(filename: str) -> list:
+    return [array('i', map(int, line.split())) for lines in read_lines_chunks(filename) for line in lines.split('\n')]
+
+
+def read_adjacency_matrix(filename: str):
+    result, n, width = [], 0, 0
+    for block in read_matrix_blocks(filename):
+        if n == 0:
+            width = len(block[0])
+            if numpy_backend.is_enabled():
+                result = numpy_backend.numpy.zeros((width, width), dtype=numpy_backend.numpy.int8)
+        if n + len(block) > width:
+            raise ValueError(f"'{filename}': adjacency matrix has more than {width} rows")
+        if numpy_backend.is_enabled():
+            result[n:n + len(block)] = block
+        else:
+            result.extend(block)
+        n += len(block)
+    if n != width:
+        raise ValueError(f"'{filename}': adjacency matrix has {n} rows and {width} columns")
+    return result
+
+
+def read_bitset_adjacency_matrix(filename: str) -> BitsetAdjacencyMatrix:
+    rows, loops, width = [], {}, 0
+    for block in read_matrix_blocks(filename):
+        width = len(block[0])
+        for row in block:
+            u, row = len(rows), bytes(row)
+            if u >= width:
+                raise ValueError(f"'{filename}': adjacency matrix has more than {width} rows")
+            if row[u] != 0:
+                loops[u] = row[u]
+            rows.append(BitsetAdjacencyMatrix.row_from_bytes(row) & ~(1 << u))
+    if len(rows) != width:
+        raise ValueError(f"'{filename}': adjacency matrix has {len(rows)} rows and {width} columns")
+    return BitsetAdjacencyMatrix(len(rows), rows, loops)
+
+
+def read_incidence_matrix(filename: str) -> list:
+    return [array('b', row.tobytes()) if numpy_backend.is_array(row) else row
+            for block in read_matrix_blocks(filename, keep_empty_rows=True) for row in block]
+
+
+def read_sparse_incidence_matrix(filename: str) -> SparseIncidenceMatrix:
+    columns, n = None, 0
+    for block in read_matrix_blocks(filename, keep_empty_rows=True):
+        if columns is None:
+            columns = [[] for _ in range(len(block[0]))]
+        if numpy_backend.is_array(block):
+            rows, k_edges = block.nonzero()
+            entries = zip((rows + n).tolist(), k_edges.tolist(), block[rows, k_edges].tolist())
+        else:
+            entries = ((n + i, k_edge, degree) for i, row in enumerate(block)
+                       for k_edge, degree in enumerate(row) if degree != 0)
+        for i, k_edge, degree in entries:
+            columns[k_edge].append((i, degree))
+        n += len(block)
+    return SparseIncidenceMatrix.from_columns(n, columns or [])
+
+
+def read_graph(filename: str, state: Graph.State, name: str = '') -> Graph:
+    state_to_reader = {
+        Graph.State.ADJACENCY_LIST: read_adjacency_list,
+        Graph.State.ADJACENCY_MATRIX: read_adjacency_matrix,
+        Graph.State.INCIDENCE_MATRIX: read_incidence_matrix,
+        Graph.State.SPARSE_INCIDENCE: read_sparse_incidence_matrix,
+        Graph.State.BITSET_ADJACENCY: read_bitset_adjacency_matrix
+    }
+    return Graph(state_to_reader[state](filename), state, name)
+
+
+def read_edge_list_vertices_number(filename: str) -> int:
+    with open_text(filename) as file:
+        for line in file:
+            if not line.startswith('#'):
+                break
+            words = line[1:].split()
+            if len(words) == 2 and words[0] == 'vertices':
+                return int(words[1])
+    return 0
+
+
+def read_edge_list_arcs(filename: str):
+    for lines in read_lines_chunks(filename):
+        for line in lines.split('\n'):
+            numbers = line.split()
+            if len(numbers) == 0 or line.startswith('#'):
+                continue
+            if len(numbers) < 2:
+                raise ValueError(f"'{filename}': edge list line '{line}' has no 'u v' pair")
+            u, v = int(numbers[0]), int(numbers[1])
+            if u < 0 or v < 0:
+                raise ValueError(f"'{filename}': edge list line '{line}' has a negative vertex")
+            yield u, v
+
+
+def capped_row(u: int, row: array) -> array:
+    result = array('i')
+    for v in sorted(row):
+        if len(result) == 0 or result[-1] != v or v == u and (len(result) < 2 or result[-2] != v):
+            result.append(v)
+    return result
+
+
+def arcs_to_adjacency_list(arcs, n: int) -> list:
+    rows = [array('i') for _ in range(n)]
+    for u, v in arcs:
+        if max(u, v) >= len(rows):
+            rows.extend(array('i') for _ in range(max(u, v) + 1 - len(rows)))
+        rows[u].append(v)
+    return [capped_row(u, row) for u, row in enumerate(rows)]
+
+
+def arcs_to_adjacency_matrix(arcs, n: int):
+    return adjacency_list_to_adjacency_matrix(arcs_to_adjacency_list(arcs, n))
+
+
+def arcs_to_incidence_columns(arcs, n: int) -> tuple:
+    columns, column_indices = [], {}
+    for u, v in arcs:
+        n = max(n, u + 1, v + 1)
+        key = (min(u, v), max(u, v))
+        k_edge = column_indices.setdefault(key, len(columns))
+        if k_edge == len(columns):
+            columns.append(((u, 1),) if u == v else ((u, 1), (v, -1)) if u < v else ((v, -1), (u, 1)))
+        elif u == v:
+            columns[k_edge] = ((u, min(2, columns[k_edge][0][1] + 1)),)
+        elif dict(columns[k_edge])[u] != 1:
+            columns[k_edge] = ((key[0], 1), (key[1], 1))
+    return n, columns
+
+
+def arcs_to_incidence_matrix(arcs, n: int) -> list:
+    return incidence_columns_to_incidence_matrix(*arcs_to_incidence_columns(arcs, n))
+
+
+def arcs_to_sparse_incidence_matrix(arcs, n: int) -> SparseIncidenceMatrix:
+    return SparseIncidenceMatrix.from_columns(*arcs_to_incidence_columns(arcs, n))
+
+
+def arcs_to_bitset_adjacency_matrix(arcs, n: int) -> BitsetAdjacencyMatrix:
+    rows, loops = [0] * n, {}
+    for u, v in arcs:
+        if max(u, v) >= len(rows):
+            rows.extend([0] * (max(u, v) + 1 - len(rows)))
+        if u == v:
+            loops[u] = min(2, loops.get(u, 0) + 1)
+        else:
+            rows[u] |= 1 << v
+    return BitsetAdjacencyMatrix(len(rows), rows, loops)
+
+
+def read_edge_list(filename: str, state: Graph.State, name: str = '') -> Graph:
+    state_to_builder = {
+        Graph.State.ADJACENCY_LIST: arcs_to_adjacency_list,
+        Graph.State.ADJACENCY_MATRIX: arcs_to_adjacency_matrix,
+        Graph.State.INCIDENCE_MATRIX: arcs_to_incidence_matrix,
+        Graph.State.SPARSE_INCIDENCE: arcs_to_sparse_incidence_matrix,
+        Graph.State.BITSET_ADJACENCY: arcs_to_bitset_adjacency_matrix
+    }
+    arcs = read_edge_list_arcs(filename)
+    return Graph(state_to_builder[state](arcs, read_edge_list_vertices_number(filename)), state, name)
+
+
+@contextmanager
+def replaced_file(filename: str, mode: str):
+    temporary_filename, mode = f'{filename}.{uuid.uuid4().hex}.tmp', mode.replace('w', 'x')
+    try:
+        with gzip.open(temporary_filename, mode) if filename.endswith('.gz') else open(temporary_filename, mode) as file:
+            yield file
+        os.replace(temporary_filename, filename)
+    finally:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+
+
+def write_edge_list(filename: str, graph: Graph) -> None:
+    with replaced_file(filename, 'wt') as file:
+        file.write(f'# vertices {len(graph.vertices())}\n')
+        file.writelines(f'{u} {v}\n' for u, v in graph.arcs())
+
+
+def write_list2(filename: str, matrix: list) -> None:
+    with replaced_file(filename, 'wt') as file:
+        for row in matrix:
+            file.write(' '.join([str(number) for number in row]))
+            file.write('\n')
+
+
+def padded_size(size: int) -> int:
+    return (size + 7) // 8 * 8
+
+
+def write_padded(file, data: bytes) -> None:
+    file.write(data)
+    file.write(bytes(padded_size(len(data)) - len(data)))
+
+
+def packed_row_size(n: int) -> int:
+    return (n + 7) // 8
+
+
+def write_binary_graph(filename: str, graph: Graph) -> None:
+    list2, name = graph.list2, graph.name.encode()
+    n, m = len(list2), graph.edges_number()
+    with replaced_file(filename, 'wb') as file:
+        file.write(__binary_header__.pack(__binary_magic__, __binary_version__, graph.state.value, n, m, len(name)))
+        write_padded(file, name)
+        if graph.state == Graph.State.ADJACENCY_LIST:
+            offsets = array('q', [0])
+            for row in list2:
+                offsets.append(offsets[-1] + len(row))
+            write_padded(file, offsets.tobytes())
+            for row in list2:
+                file.write(array('i', row).tobytes())
+        elif graph.state == Graph.State.SPARSE_INCIDENCE:
+            write_padded(file, array('q', list2.offsets).tobytes())
+            write_padded(file, array('i', list2.rows).tobytes())
+            file.write(array('b', list2.degrees).tobytes())
+        elif graph.state == Graph.State.BITSET_ADJACENCY:
+            for row in list2.rows:
+                file.write(row.to_bytes(packed_row_size(n), 'little'))
+            file.write(bytes(list2.loops.get(u, 0) for u in range(n)))
+        else:
+            for row in list2:
+                file.write(array('b', row).tobytes())
+
+
+def is_binary_graph_file(filename: str) -> bool:
+    with open(filename, 'rb') as file:
+        return file.read(len(__binary_magic__)) == __binary_magic__
+
+
+def open_binary_graph(filename: str) -> Graph:
+    with open(filename, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapping)
+    if len(buffer) < __binary_header__.size:
+        raise ValueError(f"'{filename}': file is too short for a binary graph header")
+    magic, version, state_value, n, m, name_length = __binary_header__.unpack_from(buffer)
+    if magic != __binary_magic__:
+        raise ValueError(f"'{filename}': not a binary graph file")
+    if version > __binary_version__:
+        raise ValueError(f"'{filename}': unsupported binary graph version {version}")
+    state = Graph.State(state_value)
+    begin = __binary_header__.size
+    name = bytes(buffer[begin:begin + name_length]).decode()
+    begin += padded_size(name_length)
+    if state == Graph.State.ADJACENCY_LIST:
+        offsets = buffer[begin:begin + 8 * (n + 1)]
+        begin += padded_size(len(offsets))
+        list2 = MappedAdjacencyList(offsets, buffer[begin:begin + 4 * offsets.cast('q')[n]], n, m)
+    elif state == Graph.State.SPARSE_INCIDENCE:
+        offsets = buffer[begin:begin + 8 * (m + 1)].cast('q')
+        begin += padded_size(8 * (m + 1))
+        rows = buffer[begin:begin + 4 * offsets[m]].cast('i')
+        begin += padded_size(4 * offsets[m])
+        list2 = SparseIncidenceMatrix(n, offsets, rows, buffer[begin:begin + offsets[m]].cast('b'))
+    elif state == Graph.State.BITSET_ADJACENCY:
+        size = packed_row_size(n)
+        rows = [int.from_bytes(buffer[begin + u * size:begin + (u + 1) * size], 'little') for u in range(n)]
+        begin += n * size
+        loops = {u: count for u, count in enumerate(buffer[begin:begin + n]) if count != 0}
+        list2 = BitsetAdjacencyMatrix(n, rows, loops)
+    else:
+        width = n if state == Graph.State.ADJACENCY_MATRIX else m
+        list2 = MappedMatrix(buffer[begin:begin + n * width], n, width, m)
+    buffer.release()
+    if isinstance(list2, (MappedList2, SparseIncidenceMatrix)):
+        list2.mapping = mapping
+    else:
+        mapping.close()
+    return Graph(list2, state, name)
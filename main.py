@@ -1,5 +1,18 @@
 from menu import Menu
+import argparse
+import numpy_backend
+import parallel
+import profiling
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Graphs workspace')
+    parser.add_argument('--workers', type=int, default=0, help='number of worker processes for large graphs')
+    parser.add_argument('--profile', action='store_true', help='collect timings of conversions and graph operations')
+    arguments = parser.parse_args()
+    numpy_backend.enable()
+    if arguments.workers != 0:
+        parallel.enable(arguments.workers)
+    if arguments.profile:
+        profiling.enable()
     Menu().run()
@@ -0,0 +1,69 @@
+from array import array
+
+
+class MappedList2:
+    mapping = None
+
+    def __init__(self, n: int, m: int):
+        self.n = n
+        self.m = m
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i: int) -> memoryview:
+        if i not in range(self.n):
+            raise IndexError('row index out of range')
+        return self.row(i)
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self.row(i)
+
+    def __reduce__(self):
+        return list, (self.materialize(),)
+
+    def row(self, i: int) -> memoryview:
+        raise NotImplementedError
+
+    def release(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self.mapping is not None:
+            self.release()
+            self.mapping.close()
+            self.mapping = None
+
+    def edges_number(self) -> int:
+        return self.m
+
+    def materialize(self) -> list:
+        return [array(row.format, row.tobytes()) for row in self]
+
+
+class MappedMatrix(MappedList2):
+    def __init__(self, buffer: memoryview, n: int, width: int, m: int):
+        super().__init__(n, m)
+        self.buffer = buffer.cast('b')
+        self.width = width
+
+    def row(self, i: int) -> memoryview:
+        return self.buffer[i * self.width:(i + 1) * self.width]
+
+    def release(self) -> None:
+        self.buffer.release()
+
+
+class MappedAdjacencyList(MappedList2):
+    def __init__(self, offsets: memoryview, targets: memoryview, n: int, m: int):
+        super().__init__(n, m)
+        self.offsets = offsets.cast('q')
+        self.targets = targets.cast('i')
+
+    def row(self, i: int) -> memoryview:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def release(self) -> None:
+        self.offsets.release()
+        self.targets.release()
@@ -1,23 +1,15 @@
-from graph import (Graph, str_data_matrix_to_str)
+from graph import (Graph, str_data_matrix_to_lines)
+from graph_file import (is_binary_graph_file, open_binary_graph, read_edge_list, read_graph, write_binary_graph,
+                        write_edge_list, write_list2)
+from itertools import islice
+from session_store import SessionStore
 import os
 import pickle
-
-
-def read_list2(filename: str) -> list:
-    with open(filename, 'r') as file:
-        return [[int(number) for number in line.split()] for line in file]
-
-
-def write_list2(filename: str, matrix: list) -> None:
-    with open(filename, 'w') as file:
-        for i, row in enumerate(matrix):
-            file.write(' '.join([str(number) for number in row]))
-            if i != len(matrix) - 1:
-                file.write('\n')
+import profiling
 
 
 def clear_screen() -> None:
-    os.system('cls' if os.name == 'nt' else 'clear')
+    print('\033[2J\033[H', end='', flush=True)
 
 
 def select(message: str) -> int:
@@ -32,19 +24,29 @@ def press_enter_for_continue() -> None:
     input('Press ENTER for continue...')
 
 
+def print_lines_by_pages(lines, page_size: int) -> None:
+    lines = iter(lines)
+    while len(page := list(islice(lines, page_size))) != 0:
+        print('\n'.join(page))
+        if len(page) == page_size and input('Press ENTER for next page or 0 for skip...') == '0':
+            return
+
+
 class Menu:
-    __filename__ = 'graphs.bin'
+    __filename__ = 'graphs.store'
+    __legacy_filename__ = 'graphs.bin'
+    __page_size__ = 50
 
     def __init__(self):
-        if os.path.isfile(Menu.__filename__):
-            with open(Menu.__filename__, 'rb') as file:
-                self.graphs: list = pickle.load(file)
-        else:
-            self.graphs = []
+        is_new_store = not os.path.isfile(Menu.__filename__)
+        self.graphs = SessionStore(Menu.__filename__)
+        if is_new_store and os.path.isfile(Menu.__legacy_filename__):
+            with open(Menu.__legacy_filename__, 'rb') as file:
+                for graph in pickle.load(file):
+                    self.graphs.append(graph)
 
     def __del__(self):
-        with open(Menu.__filename__, 'wb') as file:
-            pickle.dump(self.graphs, file)
+        self.graphs.close()
 
     @staticmethod
     def select_item_with_backing_and_double_clearing(items_and_functions: list) -> int:
@@ -64,8 +66,11 @@ class Menu:
                 ('existing graphs', self.existing_graphs),
                 ('addition of graph', self.addition_graph),
                 ('union of graphs', self.union_graphs),
+                ('intersection of graphs', self.intersection_graphs),
+                ('symmetric difference of graphs', self.xor_graphs),
                 ('connection of graphs', self.connection_graphs)
             ]
+            items_and_functions.append(('profiling stats', Menu.profiling_stats))
             i = Menu.select_item_with_backing_and_double_clearing(items_and_functions)
             if i == 0:
                 return
@@ -77,18 +82,26 @@ class Menu:
 
     def new_graph(self) -> None:
         filename = input('Enter filename with graph: ')
+        if is_binary_graph_file(filename):
+            self.graphs.append(open_binary_graph(filename))
+            return
         states_names = Graph.State.get_names()
         print('Graph states:')
         for i, state_name in enumerate(states_names, start=1):
             print(f'{i}) {state_name}')
+        print(f'{len(states_names) + 1}) edge list')
         i = int(input('Select graph input format: ')) - 1
-        self.graphs.append(Graph(read_list2(filename), Graph.State.get_by_name(states_names[i]), filename))
+        if i == len(states_names):
+            i = int(input('Select graph state: ')) - 1
+            self.graphs.append(read_edge_list(filename, Graph.State.get_by_name(states_names[i]), filename))
+            return
+        self.graphs.append(read_graph(filename, Graph.State.get_by_name(states_names[i]), filename))
 
     def existing_graphs(self) -> None:
         while True:
             if len(self.graphs) == 0:
                 return
-            graphs_names = [graph.name for graph in self.graphs]
+            graphs_names = self.graphs.names()
             clear_screen()
             for i, graph_name in enumerate(graphs_names, start=1):
                 print(f"{i}) Graph: '{graph_name}'")
@@ -99,6 +112,7 @@ class Menu:
             self.manage_graph(i - 1)
 
     def manage_graph(self, graph_i: int) -> None:
+        self.graphs[graph_i].start_journal()
         while True:
             items_and_functions = [
                 ('print_info', Menu.print_graph_info),
@@ -111,6 +125,8 @@ class Menu:
                 ('pull off edge', Menu.pull_off_edge),
                 ('add directed edge', Menu.add_directed_edge),
                 ('remove directed edge', Menu.remove_directed_edge),
+                ('undo', Menu.undo_edit),
+                ('redo', Menu.redo_edit),
                 ('save to file', Menu.save_to_file),
                 ('remove graph', Menu.remove_graph_by_index)
             ]
@@ -121,15 +137,16 @@ class Menu:
                 Menu.remove_graph_by_index(self, graph_i)
                 return
             items_and_functions[i - 1][1](self.graphs[graph_i])
+            self.graphs.sync(graph_i)
 
     @staticmethod
     def print_graph_info(graph: Graph) -> None:
-        print(graph)
+        print_lines_by_pages(graph.lines(), Menu.__page_size__)
         print()
         print(f'State: {Graph.State.to_name(graph.state)}')
         print(f'Vertices number: {len(graph.vertices())}')
         print(f'Edges number: {graph.edges_number()}')
-        print(f'Directed edges number: {len(graph.directed_edges())}')
+        print(f'Directed edges number: {sum(out_degree for _, out_degree in graph.degree_sequence())}')
         print()
         press_enter_for_continue()
 
@@ -186,17 +203,17 @@ class Menu:
 
     @staticmethod
     def print_vertices_degrees(graph: Graph) -> None:
-        n = len(graph.vertices())
-        directed_edges = graph.directed_edges()
+        degree_sequence = graph.degree_sequence()
+        n = len(degree_sequence)
         data = [[' '] * (n + 1) for _ in range(3)]
         for j in range(1, n + 1):
             data[0][j] = f'v_{j}'
         data[1][0] = 'in  degree'
         data[2][0] = 'out degree'
-        for v in range(n):
-            data[1][v + 1] = str(sum([1 for i, j in directed_edges if j == v]))
-            data[2][v + 1] = str(sum([1 for i, j in directed_edges if i == v]))
-        print(str_data_matrix_to_str(data))
+        for v, (in_degree, out_degree) in enumerate(degree_sequence):
+            data[1][v + 1] = str(in_degree)
+            data[2][v + 1] = str(out_degree)
+        print_lines_by_pages(str_data_matrix_to_lines(lambda: data), Menu.__page_size__)
         press_enter_for_continue()
 
     @staticmethod
@@ -251,10 +268,36 @@ class Menu:
             return
         graph.remove_directed_edge(graph.directed_edges()[i - 1])
 
+    @staticmethod
+    def undo_edit(graph: Graph) -> None:
+        if not graph.undo():
+            print('Nothing to undo')
+            press_enter_for_continue()
+
+    @staticmethod
+    def redo_edit(graph: Graph) -> None:
+        if not graph.redo():
+            print('Nothing to redo')
+            press_enter_for_continue()
+
     @staticmethod
     def save_to_file(graph: Graph) -> None:
         filename = input(f"Enter filename for saving graph '{graph.name}': ")
-        write_list2(filename, graph.list2)
+        print('File formats:')
+        print('1) text')
+        print('2) binary')
+        print('3) edge list')
+        i = select('file format')
+        if i not in range(1, 4):
+            print('Incorrect file format number')
+            press_enter_for_continue()
+            return
+        if i == 1:
+            write_list2(filename, graph.list2)
+        elif i == 2:
+            write_binary_graph(filename, graph)
+        else:
+            write_edge_list(filename, graph)
 
     def remove_graph_by_index(self, graph_i: int) -> None:
         if graph_i not in range(len(self.graphs)):
@@ -263,23 +306,31 @@ class Menu:
             return
         del self.graphs[graph_i]
 
+    def append_result(self, graph: Graph) -> None:
+        i = self.graphs.find(graph)
+        if i is not None:
+            print(f"The result is the same as graph '{self.graphs.names()[i]}'")
+            press_enter_for_continue()
+            return
+        self.graphs.append(graph)
+
     def addition_graph(self) -> None:
         graphs = self.graphs
         print('Graphs:')
-        for i, graph in enumerate(graphs, start=1):
-            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph.name}'")
+        for i, graph_name in enumerate(graphs.names(), start=1):
+            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph_name}'")
         i = select('graph for addition')
         if i not in range(1, len(self.graphs) + 1):
             print('Incorrect graph number')
             press_enter_for_continue()
             return
-        graphs.append(Graph.addition(graphs[i - 1]))
+        self.append_result(Graph.addition(graphs[i - 1]).materialize())
 
     def union_graphs(self) -> None:
         graphs = self.graphs
         print('Graphs:')
-        for i, graph in enumerate(graphs, start=1):
-            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph.name}'")
+        for i, graph_name in enumerate(graphs.names(), start=1):
+            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph_name}'")
         i = select('first graph for union')
         if i not in range(1, len(self.graphs) + 1):
             print('Incorrect first graph number')
@@ -290,19 +341,47 @@ class Menu:
             print('Incorrect second graph number')
             press_enter_for_continue()
             return
-        graphs.append(graphs[i - 1].union(graphs[j - 1]))
+        self.append_result(graphs[i - 1].union(graphs[j - 1]).materialize())
 
-    # def intersection_graphs(self):
-    #     pass
-    #
-    # def xor_graphs(self):
-    #     pass
+    def intersection_graphs(self) -> None:
+        graphs = self.graphs
+        print('Graphs:')
+        for i, graph_name in enumerate(graphs.names(), start=1):
+            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph_name}'")
+        i = select('first graph for intersection')
+        if i not in range(1, len(self.graphs) + 1):
+            print('Incorrect first graph number')
+            press_enter_for_continue()
+            return
+        j = select('second graph for intersection')
+        if j not in range(1, len(self.graphs) + 1):
+            print('Incorrect second graph number')
+            press_enter_for_continue()
+            return
+        self.append_result(graphs[i - 1].intersection(graphs[j - 1]).materialize())
+
+    def xor_graphs(self) -> None:
+        graphs = self.graphs
+        print('Graphs:')
+        for i, graph_name in enumerate(graphs.names(), start=1):
+            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph_name}'")
+        i = select('first graph for symmetric difference')
+        if i not in range(1, len(self.graphs) + 1):
+            print('Incorrect first graph number')
+            press_enter_for_continue()
+            return
+        j = select('second graph for symmetric difference')
+        if j not in range(1, len(self.graphs) + 1):
+            print('Incorrect second graph number')
+            press_enter_for_continue()
+            return
+        self.append_result(graphs[i - 1].symmetric_difference(graphs[j - 1]).materialize())
 
     def connection_graphs(self) -> None:
         graphs = self.graphs
         print('Graphs:')
-        for i, graph in enumerate(graphs, start=1):
-            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph.name}'")
+        for i, graph_name in enumerate(graphs.names(), start=1):
+            print(f"{str(i).rjust(len(str(len(graphs))))}) '{graph_name}'")
         i = select('first graph for connection')
         if i not in range(1, len(self.graphs) + 1):
             print('Incorrect first graph number')
@@ -313,4 +392,22 @@ class Menu:
             print('Incorrect second graph number')
             press_enter_for_continue()
             return
-        graphs.append(graphs[i - 1].connection(graphs[j - 1]))
+        self.append_result(graphs[i - 1].connection(graphs[j - 1]).materialize())
+
+    @staticmethod
+    def profiling_stats() -> None:
+        print(f"Profiling: {'on' if profiling.is_enabled() else 'off'}")
+        print()
+        rows = [[f'{row[0]} '] + row[1:] for row in profiling.report()]
+        print_lines_by_pages(str_data_matrix_to_lines(lambda: rows), Menu.__page_size__)
+        print()
+        print(f"1) {'disable' if profiling.is_enabled() else 'enable'} profiling")
+        print('2) reset stats')
+        print('0) back')
+        i = select_item()
+        if i == 1 and profiling.is_enabled():
+            profiling.disable()
+        elif i == 1:
+            profiling.enable()
+        elif i == 2:
+            profiling.reset()
@@ -0,0 +1,88 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__enabled__ = False
+
+
+def is_available() -> bool:
+    return numpy is not None
+
+
+def is_enabled() -> bool:
+    return __enabled__
+
+
+def enable() -> bool:
+    global __enabled__
+    __enabled__ = is_available()
+    return __enabled__
+
+
+def disable() -> None:
+    global __enabled__
+    __enabled__ = False
+
+
+def is_array(list2) -> bool:
+    return numpy is not None and isinstance(list2, numpy.ndarray)
+
+
+def to_adjacency_array(adjacency_matrix):
+    return numpy.asarray(adjacency_matrix, dtype=numpy.int8).reshape(len(adjacency_matrix), len(adjacency_matrix))
+
+
+def adjacency_counts_to_adjacency_array(adjacency_counts: list):
+    result = numpy.zeros((len(adjacency_counts), len(adjacency_counts)), dtype=numpy.int8)
+    for u, counts in enumerate(adjacency_counts):
+        if len(counts) != 0:
+            result[u, list(counts.keys())] = list(counts.values())
+    return result
+
+
+def adjacency_array_to_adjacency_counts(adjacency_array) -> list:
+    result = []
+    for row in adjacency_array:
+        vertices = numpy.flatnonzero(row)
+        result.append(dict(zip(vertices.tolist(), row[vertices].tolist())))
+    return result
+
+
+def addition(adjacency_matrix):
+    result = (to_adjacency_array(adjacency_matrix) == 0).astype(numpy.int8)
+    numpy.fill_diagonal(result, 0)
+    return result
+
+
+def union_addition(adjacency_matrix1, adjacency_matrix2):
+    n1, n2 = len(adjacency_matrix1), len(adjacency_matrix2)
+    result = numpy.ones((n1 + n2, n1 + n2), dtype=numpy.int8)
+    result[:n1, :n1] = addition(adjacency_matrix1)
+    result[n1:, n1:] = addition(adjacency_matrix2)
+    return result
+
+
+def __canonical_adjacency_array__(adjacency_matrix):
+    adjacency_array = to_adjacency_array(adjacency_matrix)
+    result = numpy.minimum(adjacency_array, 1)
+    numpy.fill_diagonal(result, adjacency_array.diagonal())
+    return result
+
+
+def union(adjacency_matrix1, adjacency_matrix2):
+    adjacency_array1 = __canonical_adjacency_array__(adjacency_matrix1)
+    adjacency_array2 = __canonical_adjacency_array__(adjacency_matrix2)
+    n1, n2 = len(adjacency_array1), len(adjacency_array2)
+    result = numpy.zeros((n1 + n2, n1 + n2), dtype=numpy.int8)
+    result[:n1, :n1] = adjacency_array1
+    result[n1:, n1:] = adjacency_array2
+    return result
+
+
+def insert_vertex(adjacency_array, v: int):
+    return numpy.insert(numpy.insert(adjacency_array, v, 0, axis=0), v, 0, axis=1)
+
+
+def delete_vertex(adjacency_array, v: int):
+    return numpy.delete(numpy.delete(adjacency_array, v, axis=0), v, axis=1)
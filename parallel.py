@@ -0,0 +1,198 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy_backend
+import os
+import re
+
+__executor__ = None
+__workers_number__ = 0
+__min_vertices_number__ = 2048
+__nonzero_pattern__ = re.compile(b'[^\x00]')
+__addition_table__ = bytes([1]) + bytes(255)
+
+
+def is_enabled() -> bool:
+    return __executor__ is not None
+
+
+def workers_number() -> int:
+    return __workers_number__
+
+
+def enable(workers_number: int = None, min_vertices_number: int = 2048) -> int:
+    global __executor__, __workers_number__, __min_vertices_number__
+    disable()
+    __workers_number__ = workers_number or os.cpu_count() or 1
+    __min_vertices_number__ = min_vertices_number
+    __executor__ = ProcessPoolExecutor(__workers_number__)
+    return __workers_number__
+
+
+def disable() -> None:
+    global __executor__, __workers_number__
+    if __executor__ is not None:
+        __executor__.shutdown()
+    __executor__ = None
+    __workers_number__ = 0
+
+
+def is_worth(n: int) -> bool:
+    return is_enabled() and n >= __min_vertices_number__
+
+
+def row_ranges(n: int) -> list:
+    chunks_number = min(n, 4 * __workers_number__) or 1
+    bounds = [n * k // chunks_number for k in range(chunks_number + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def __create_shared__(size: int) -> shared_memory.SharedMemory:
+    return shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+
+def __release_shared__(*memories) -> None:
+    for memory in memories:
+        memory.close()
+        memory.unlink()
+
+
+def __share_adjacency_matrix__(adjacency_matrix) -> shared_memory.SharedMemory:
+    n = len(adjacency_matrix)
+    memory = __create_shared__(n * n)
+    if numpy_backend.is_array(adjacency_matrix):
+        memory.buf[:n * n] = adjacency_matrix.astype(numpy_backend.numpy.int8).tobytes()
+    else:
+        for i, row in enumerate(adjacency_matrix):
+            memory.buf[i * n:(i + 1) * n] = bytes(row)
+    return memory
+
+
+def __share_adjacency_list__(adjacency_list: list) -> tuple:
+    offsets, targets = array('q', [0]), array('i')
+    for adjacency in adjacency_list:
+        targets.extend(adjacency)
+        offsets.append(len(targets))
+    offsets_memory, targets_memory = __create_shared__(8 * len(offsets)), __create_shared__(4 * len(targets))
+    offsets_memory.buf[:8 * len(offsets)] = offsets.tobytes()
+    targets_memory.buf[:4 * len(targets)] = targets.tobytes()
+    return offsets_memory, targets_memory
+
+
+def __shared_matrix_to_list2__(memory: shared_memory.SharedMemory, n: int):
+    if numpy_backend.is_enabled():
+        numpy = numpy_backend.numpy
+        return numpy.frombuffer(memory.buf, dtype=numpy.int8, count=n * n).reshape(n, n).copy()
+    with memory.buf[:n * n] as result_bytes, result_bytes.cast('b') as buffer:
+        return [array('b', buffer[i * n:(i + 1) * n].tobytes()) for i in range(n)]
+
+
+def __adjacency_rows__(name: str, n: int, begin: int, end: int) -> tuple:
+    memory = shared_memory.SharedMemory(name=name)
+    lengths, targets = array('q'), array('i')
+    for i in range(begin, end):
+        row = bytes(memory.buf[i * n:(i + 1) * n])
+        length = len(targets)
+        for match in __nonzero_pattern__.finditer(row):
+            targets.extend([match.start()] * row[match.start()])
+        lengths.append(len(targets) - length)
+    memory.close()
+    return lengths.tobytes(), targets.tobytes()
+
+
+def adjacency_matrix_to_adjacency_list(adjacency_matrix) -> list:
+    n = len(adjacency_matrix)
+    memory = __share_adjacency_matrix__(adjacency_matrix)
+    try:
+        chunks = list(__executor__.map(__adjacency_rows__, *zip(*[(memory.name, n, begin, end)
+                                                                  for begin, end in row_ranges(n)])))
+    finally:
+        __release_shared__(memory)
+    result = []
+    for lengths_bytes, targets_bytes in chunks:
+        lengths, targets, offset = array('q', lengths_bytes), array('i', targets_bytes), 0
+        for length in lengths:
+            result.append(targets[offset:offset + length])
+            offset += length
+    return result
+
+
+def __fill_adjacency_rows__(offsets_name: str, targets_name: str, result_name: str, n: int, begin: int, end: int) -> None:
+    offsets_memory = shared_memory.SharedMemory(name=offsets_name)
+    targets_memory = shared_memory.SharedMemory(name=targets_name)
+    result_memory = shared_memory.SharedMemory(name=result_name)
+    with offsets_memory.buf[:8 * (n + 1)] as offsets_bytes, offsets_bytes.cast('q') as offsets:
+        with targets_memory.buf[:4 * offsets[n]] as targets_bytes, targets_bytes.cast('i') as targets:
+            with result_memory.buf[:n * n] as result_bytes, result_bytes.cast('b') as result:
+                for i in range(begin, end):
+                    for v in targets[offsets[i]:offsets[i + 1]]:
+                        result[i * n + v] += 1
+    for memory in [offsets_memory, targets_memory, result_memory]:
+        memory.close()
+
+
+def adjacency_list_to_adjacency_matrix(adjacency_list: list):
+    n = len(adjacency_list)
+    offsets_memory, targets_memory = __share_adjacency_list__(adjacency_list)
+    result_memory = __create_shared__(n * n)
+    try:
+        result_memory.buf[:n * n] = bytes(n * n)
+        list(__executor__.map(__fill_adjacency_rows__, *zip(*[
+            (offsets_memory.name, targets_memory.name, result_memory.name, n, begin, end) for begin, end in row_ranges(n)
+        ])))
+        return __shared_matrix_to_list2__(result_memory, n)
+    finally:
+        __release_shared__(offsets_memory, targets_memory, result_memory)
+
+
+def __addition_rows__(name: str, result_name: str, n: int, begin: int, end: int) -> None:
+    memory = shared_memory.SharedMemory(name=name)
+    result_memory = shared_memory.SharedMemory(name=result_name)
+    for i in range(begin, end):
+        row = bytearray(bytes(memory.buf[i * n:(i + 1) * n]).translate(__addition_table__))
+        row[i] = 0
+        result_memory.buf[i * n:(i + 1) * n] = row
+    memory.close()
+    result_memory.close()
+
+
+def addition(adjacency_matrix):
+    n = len(adjacency_matrix)
+    memory = __share_adjacency_matrix__(adjacency_matrix)
+    result_memory = __create_shared__(n * n)
+    try:
+        list(__executor__.map(__addition_rows__, *zip(*[(memory.name, result_memory.name, n, begin, end)
+                                                        for begin, end in row_ranges(n)])))
+        return __shared_matrix_to_list2__(result_memory, n)
+    finally:
+        __release_shared__(memory, result_memory)
+
+
+def __in_degrees__(offsets_name: str, targets_name: str, n: int, begin: int, end: int) -> bytes:
+    offsets_memory = shared_memory.SharedMemory(name=offsets_name)
+    targets_memory = shared_memory.SharedMemory(name=targets_name)
+    in_degrees = array('q', bytes(8 * n))
+    with offsets_memory.buf[:8 * (n + 1)] as offsets_bytes, offsets_bytes.cast('q') as offsets:
+        with targets_memory.buf[:4 * offsets[n]] as targets_bytes, targets_bytes.cast('i') as targets:
+            for v in targets[offsets[begin]:offsets[end]]:
+                in_degrees[v] += 1
+    offsets_memory.close()
+    targets_memory.close()
+    return in_degrees.tobytes()
+
+
+def adjacency_list_degrees(adjacency_list: list) -> tuple:
+    n = len(adjacency_list)
+    offsets_memory, targets_memory = __share_adjacency_list__(adjacency_list)
+    try:
+        partial_in_degrees = list(__executor__.map(__in_degrees__, *zip(*[
+            (offsets_memory.name, targets_memory.name, n, begin, end) for begin, end in row_ranges(n)
+        ])))
+        offsets = array('q', bytes(offsets_memory.buf[:8 * (n + 1)]))
+    finally:
+        __release_shared__(offsets_memory, targets_memory)
+    in_degrees = array('q', bytes(8 * n))
+    for partial in partial_in_degrees:
+        for v, degree in enumerate(array('q', partial)):
+            in_degrees[v] += degree
+    return in_degrees, array('q', [offsets[i + 1] - offsets[i] for i in range(n)])
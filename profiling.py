@@ -0,0 +1,76 @@
+from functools import wraps
+import time
+import tracemalloc
+
+__enabled__ = False
+__traces_allocations__ = False
+__started_tracing__ = False
+__stats__ = {}
+
+
+def is_enabled() -> bool:
+    return __enabled__
+
+
+def enable(trace_allocations: bool = True) -> None:
+    global __enabled__, __traces_allocations__, __started_tracing__
+    __enabled__ = True
+    __traces_allocations__ = trace_allocations
+    if trace_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        __started_tracing__ = True
+
+
+def disable() -> None:
+    global __enabled__, __traces_allocations__, __started_tracing__
+    if __started_tracing__:
+        tracemalloc.stop()
+    __enabled__ = False
+    __traces_allocations__ = False
+    __started_tracing__ = False
+
+
+def reset() -> None:
+    __stats__.clear()
+
+
+def measure(name: str, function, *args, **kwargs):
+    allocated_bytes = tracemalloc.get_traced_memory()[0] if __traces_allocations__ else 0
+    begin = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - begin
+        if __traces_allocations__:
+            allocated_bytes = tracemalloc.get_traced_memory()[0] - allocated_bytes
+        record = __stats__.setdefault(name, [0, 0.0, 0])
+        record[0] += 1
+        record[1] += seconds
+        record[2] += allocated_bytes
+
+
+def call(name: str, function, *args):
+    if not __enabled__:
+        return function(*args)
+    return measure(name, function, *args)
+
+
+def profiled(function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not __enabled__:
+            return function(*args, **kwargs)
+        return measure(function.__qualname__, function, *args, **kwargs)
+    return wrapper
+
+
+def stats() -> dict:
+    return {name: {'calls': calls, 'seconds': seconds, 'allocated_bytes': allocated_bytes}
+            for name, (calls, seconds, allocated_bytes) in __stats__.items()}
+
+
+def report() -> list:
+    rows = [['name', 'calls', 'seconds', 'mean seconds', 'allocated bytes']]
+    for name, (calls, seconds, allocated_bytes) in sorted(__stats__.items(), key=lambda item: -item[1][1]):
+        rows.append([name, str(calls), f'{seconds:.6f}', f'{seconds / calls:.6f}', str(allocated_bytes)])
+    return rows
@@ -0,0 +1,233 @@
+from enum import Enum
+from graph import Graph
+import os
+import pickle
+import struct
+
+
+class SessionStore:
+    class Record(Enum):
+        SNAPSHOT = 1
+        MUTATIONS = 2
+        RENAME = 3
+        DELETE = 4
+        FINGERPRINT = 5
+        DEGREES_FINGERPRINT = 6
+
+    class Entry:
+        def __init__(self, name: str):
+            self.name = name
+            self.offsets = []
+            self.mutations_number = 0
+            self.fingerprints = {}
+
+    __text_records__ = [Record.SNAPSHOT, Record.RENAME, Record.FINGERPRINT, Record.DEGREES_FINGERPRINT]
+    __fingerprint_records__ = [Record.FINGERPRINT, Record.DEGREES_FINGERPRINT]
+    __record_header__ = struct.Struct('<BIQ')
+    __name_header__ = struct.Struct('<I')
+    __snapshot_mutations_number__ = 64
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.entries = {}
+        self.graphs = {}
+        self.graph_ids = []
+        self.fingerprints = {kind: {} for kind in SessionStore.__fingerprint_records__}
+        self.next_graph_id = 0
+        self.garbage_records_number = 0
+        size = self.__scan__() if os.path.isfile(filename) else 0
+        self.file = open(filename, 'ab')
+        self.file.truncate(size)
+        self.file.seek(size)
+
+    def __scan__(self) -> int:
+        file_size = os.path.getsize(self.filename)
+        with open(self.filename, 'rb') as file:
+            offset = 0
+            while len(header := file.read(SessionStore.__record_header__.size)) == SessionStore.__record_header__.size:
+                kind, graph_id, size = SessionStore.__record_header__.unpack(header)
+                if file.tell() + size > file_size:
+                    break
+                text = ''
+                if SessionStore.Record(kind) in SessionStore.__text_records__:
+                    text_size, = SessionStore.__name_header__.unpack(file.read(SessionStore.__name_header__.size))
+                    text = file.read(text_size).decode()
+                self.__add_to_index__(SessionStore.Record(kind), graph_id, offset, text)
+                offset += SessionStore.__record_header__.size + size
+                file.seek(offset)
+            return offset
+
+    def __add_to_index__(self, kind: Record, graph_id: int, offset: int, text: str) -> None:
+        if kind == SessionStore.Record.SNAPSHOT:
+            if graph_id not in self.entries:
+                self.entries[graph_id] = SessionStore.Entry(text)
+                self.graph_ids.append(graph_id)
+                self.next_graph_id = max(self.next_graph_id, graph_id + 1)
+            else:
+                self.garbage_records_number += len(self.entries[graph_id].offsets)
+                self.__unindex_fingerprints__(graph_id)
+            self.entries[graph_id].offsets = [offset]
+            self.entries[graph_id].mutations_number = 0
+        elif kind == SessionStore.Record.DELETE:
+            self.garbage_records_number += len(self.entries[graph_id].offsets) + 1
+            self.__unindex_fingerprints__(graph_id)
+            del self.entries[graph_id]
+            self.graph_ids.remove(graph_id)
+        else:
+            self.entries[graph_id].offsets.append(offset)
+            if kind == SessionStore.Record.RENAME:
+                self.entries[graph_id].name = text
+            elif kind in SessionStore.__fingerprint_records__:
+                self.__unindex_fingerprint__(kind, graph_id)
+                self.entries[graph_id].fingerprints[kind] = text
+                self.fingerprints[kind].setdefault(text, set()).add(graph_id)
+            else:
+                self.entries[graph_id].mutations_number += 1
+                self.__unindex_fingerprints__(graph_id)
+
+    def __unindex_fingerprint__(self, kind: Record, graph_id: int) -> None:
+        fingerprint = self.entries[graph_id].fingerprints.pop(kind, None)
+        if fingerprint is None:
+            return
+        self.fingerprints[kind][fingerprint].discard(graph_id)
+        if len(self.fingerprints[kind][fingerprint]) == 0:
+            del self.fingerprints[kind][fingerprint]
+
+    def __unindex_fingerprints__(self, graph_id: int) -> None:
+        for kind in SessionStore.__fingerprint_records__:
+            self.__unindex_fingerprint__(kind, graph_id)
+
+    def __append__(self, kind: Record, graph_id: int, payload: bytes = b'', text: str = None) -> None:
+        if text is not None:
+            encoded_text = text.encode()
+            payload = SessionStore.__name_header__.pack(len(encoded_text)) + encoded_text + payload
+        offset = self.file.tell()
+        self.file.write(SessionStore.__record_header__.pack(kind.value, graph_id, len(payload)))
+        self.file.write(payload)
+        self.file.flush()
+        self.__add_to_index__(kind, graph_id, offset, text or '')
+
+    def __read__(self, offset: int) -> tuple:
+        with open(self.filename, 'rb') as file:
+            file.seek(offset)
+            kind, graph_id, size = SessionStore.__record_header__.unpack(file.read(SessionStore.__record_header__.size))
+            payload = file.read(size)
+        kind = SessionStore.Record(kind)
+        if kind in SessionStore.__text_records__:
+            text_size, = SessionStore.__name_header__.unpack_from(payload)
+            payload = payload[SessionStore.__name_header__.size + text_size:]
+        return kind, payload
+
+    def __len__(self) -> int:
+        return len(self.graph_ids)
+
+    def __getitem__(self, i: int) -> Graph:
+        graph_id = self.graph_ids[i]
+        if graph_id not in self.graphs:
+            self.graphs[graph_id] = self.__load__(graph_id)
+        return self.graphs[graph_id]
+
+    def __delitem__(self, i: int) -> None:
+        graph_id = self.graph_ids[i]
+        self.__append__(SessionStore.Record.DELETE, graph_id)
+        self.graphs.pop(graph_id, None)
+
+    def __load__(self, graph_id: int) -> Graph:
+        graph = None
+        for offset in self.entries[graph_id].offsets:
+            kind, payload = self.__read__(offset)
+            if kind == SessionStore.Record.SNAPSHOT:
+                graph = pickle.loads(payload)
+            elif kind == SessionStore.Record.MUTATIONS:
+                for method_name, args in pickle.loads(payload):
+                    getattr(graph, method_name)(*args)
+        graph.set_name(self.entries[graph_id].name)
+        graph.start_recording()
+        if self.entries[graph_id].mutations_number > SessionStore.__snapshot_mutations_number__:
+            fingerprints = dict(self.entries[graph_id].fingerprints)
+            self.__append__(SessionStore.Record.SNAPSHOT, graph_id, pickle.dumps(graph), graph.name)
+            if SessionStore.Record.DEGREES_FINGERPRINT not in fingerprints:
+                fingerprints[SessionStore.Record.DEGREES_FINGERPRINT] = graph.degrees_fingerprint()
+            for kind, fingerprint in fingerprints.items():
+                self.__append__(kind, graph_id, text=fingerprint)
+        return graph
+
+    def __append_degrees_fingerprint__(self, graph_id: int, graph: Graph) -> None:
+        self.__append__(SessionStore.Record.DEGREES_FINGERPRINT, graph_id, text=graph.degrees_fingerprint())
+
+    def __fingerprint__(self, kind: Record, i: int) -> str:
+        kind_to_fingerprint = {
+            SessionStore.Record.FINGERPRINT: Graph.fingerprint,
+            SessionStore.Record.DEGREES_FINGERPRINT: Graph.degrees_fingerprint
+        }
+        graph_id = self.graph_ids[i]
+        if kind not in self.entries[graph_id].fingerprints:
+            self.__append__(kind, graph_id, text=kind_to_fingerprint[kind](self[i]))
+        return self.entries[graph_id].fingerprints[kind]
+
+    def names(self) -> list:
+        return [self.entries[graph_id].name for graph_id in self.graph_ids]
+
+    def append(self, graph: Graph) -> None:
+        graph_id = self.next_graph_id
+        self.__append__(SessionStore.Record.SNAPSHOT, graph_id, pickle.dumps(graph), graph.name)
+        self.__append_degrees_fingerprint__(graph_id, graph)
+        graph.start_recording()
+        self.graphs[graph_id] = graph
+
+    def sync(self, i: int) -> None:
+        graph_id = self.graph_ids[i]
+        if graph_id not in self.graphs:
+            return
+        mutations = self.graphs[graph_id].take_mutations()
+        names = [args[0] for method_name, args in mutations if method_name == 'set_name']
+        mutations = [mutation for mutation in mutations if mutation[0] != 'set_name']
+        if len(mutations) != 0:
+            self.__append__(SessionStore.Record.MUTATIONS, graph_id, pickle.dumps(mutations))
+            self.__append_degrees_fingerprint__(graph_id, self.graphs[graph_id])
+        if len(names) != 0:
+            self.__append__(SessionStore.Record.RENAME, graph_id, text=names[-1])
+
+    def similar(self, graph: Graph) -> list:
+        for i, graph_id in enumerate(self.graph_ids):
+            if graph_id in self.graphs:
+                self.sync(i)
+            self.__fingerprint__(SessionStore.Record.DEGREES_FINGERPRINT, i)
+        degrees_fingerprints = self.fingerprints[SessionStore.Record.DEGREES_FINGERPRINT]
+        graph_ids = set(degrees_fingerprints.get(graph.degrees_fingerprint(), set()))
+        if len(graph_ids) == 0:
+            return []
+        for i, graph_id in enumerate(self.graph_ids):
+            if graph_id in graph_ids:
+                self.__fingerprint__(SessionStore.Record.FINGERPRINT, i)
+        graph_ids = self.fingerprints[SessionStore.Record.FINGERPRINT].get(graph.fingerprint(), set())
+        return [i for i, graph_id in enumerate(self.graph_ids) if graph_id in graph_ids]
+
+    def find(self, graph: Graph) -> int:
+        for i in self.similar(graph):
+            if len(self[i].vertices()) == len(graph.vertices()) and self[i].directed_edges() == graph.directed_edges():
+                return i
+        return None
+
+    def compact(self) -> None:
+        self.file.close()
+        with open(self.filename, 'rb') as source, open(f'{self.filename}.tmp', 'wb') as file:
+            for graph_id in self.graph_ids:
+                for offset in self.entries[graph_id].offsets:
+                    source.seek(offset)
+                    header = source.read(SessionStore.__record_header__.size)
+                    file.write(header)
+                    file.write(source.read(SessionStore.__record_header__.unpack(header)[2]))
+        os.replace(f'{self.filename}.tmp', self.filename)
+        graphs = self.graphs
+        self.__init__(self.filename)
+        self.graphs = graphs
+
+    def close(self) -> None:
+        for i in range(len(self)):
+            self.sync(i)
+        for graph in self.graphs.values():
+            graph.close()
+        if self.garbage_records_number > sum(len(entry.offsets) for entry in self.entries.values()):
+            self.compact()
+        self.file.close()
@@ -0,0 +1,100 @@
+from array import array
+
+
+class SparseIncidenceMatrix:
+    mapping = None
+
+    def __init__(self, n: int, offsets: array, rows: array, degrees: array):
+        self.n = n
+        self.offsets = offsets
+        self.rows = rows
+        self.degrees = degrees
+
+    @staticmethod
+    def from_columns(n: int, incidence_columns):
+        offsets, rows, degrees = array('q', [0]), array('i'), array('b')
+        for column in incidence_columns:
+            for i, degree in column:
+                rows.append(i)
+                degrees.append(degree)
+            offsets.append(len(rows))
+        return SparseIncidenceMatrix(n, offsets, rows, degrees)
+
+    def __getstate__(self) -> dict:
+        return {'n': self.n, 'offsets': array('q', self.offsets), 'rows': array('i', self.rows),
+                'degrees': array('b', self.degrees)}
+
+    def close(self) -> None:
+        if self.mapping is None:
+            return
+        offsets, rows, degrees = self.offsets, self.rows, self.degrees
+        self.offsets, self.rows, self.degrees = array('q', offsets), array('i', rows), array('b', degrees)
+        for view in [offsets, rows, degrees]:
+            view.release()
+        self.mapping.close()
+        self.mapping = None
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self):
+        entries = [[] for _ in range(self.n)]
+        for k_edge, column in enumerate(self.columns()):
+            for i, degree in column:
+                entries[i].append((k_edge, degree))
+        m = self.edges_number()
+        for row_entries in entries:
+            row = [0] * m
+            for k_edge, degree in row_entries:
+                row[k_edge] = degree
+            yield row
+
+    def edges_number(self) -> int:
+        return len(self.offsets) - 1
+
+    def column(self, k_edge: int) -> tuple:
+        begin, end = self.offsets[k_edge], self.offsets[k_edge + 1]
+        return tuple(zip(self.rows[begin:end], self.degrees[begin:end]))
+
+    def columns(self):
+        for k_edge in range(self.edges_number()):
+            yield self.column(k_edge)
+
+    def touching_columns(self, vertices: list) -> list:
+        offsets, rows = self.offsets, self.rows
+        return [k_edge for k_edge in range(self.edges_number())
+                if any(rows[k] in vertices for k in range(offsets[k_edge], min(offsets[k_edge] + 2, offsets[k_edge + 1])))]
+
+    def edit(self, removed_columns: list = (), removed_row: int = None, inserted_row: int = None,
+             appended_columns: list = ()):
+        removed_columns = set(removed_columns)
+        offsets, rows, degrees = array('q', [0]), array('i'), array('b')
+        for k_edge, column in enumerate(self.columns()):
+            if k_edge in removed_columns:
+                continue
+            for i, degree in column:
+                if i == removed_row:
+                    continue
+                if removed_row is not None and i > removed_row:
+                    i -= 1
+                if inserted_row is not None and i >= inserted_row:
+                    i += 1
+                rows.append(i)
+                degrees.append(degree)
+            offsets.append(len(rows))
+        for column in appended_columns:
+            for i, degree in column:
+                rows.append(i)
+                degrees.append(degree)
+            offsets.append(len(rows))
+        n = self.n - (removed_row is not None) + (inserted_row is not None)
+        return SparseIncidenceMatrix(n, offsets, rows, degrees)
+
+    def union(self, other):
+        offsets = array('q', self.offsets)
+        offsets.extend(offset + len(self.rows) for offset in other.offsets[1:])
+        rows = array('i', self.rows)
+        rows.extend(i + self.n for i in other.rows)
+        degrees = array('b', self.degrees)
+        degrees.extend(other.degrees)
+        return SparseIncidenceMatrix(self.n + other.n, offsets, rows, degrees)
@@ -0,0 +1,170 @@
+import batch
+from graph import Graph
+from graph_file import (open_binary_graph, read_edge_list, read_graph, write_binary_graph, write_edge_list,
+                        write_list2)
+import io
+import numpy_backend
+import pytest
+from session_store import SessionStore
+
+
+def connection_graph(state: Graph.State) -> Graph:
+    graph1 = Graph([[0, 1], [0, 0]], Graph.State.ADJACENCY_MATRIX, 'a')
+    graph2 = Graph([[0, 1, 0], [1, 0, 0], [0, 0, 1]], Graph.State.ADJACENCY_MATRIX, 'b')
+    graph = graph1.connection(graph2).materialize()
+    graph.set_state(state)
+    return graph
+
+
+def test_materialized_connection_does_not_depend_on_query_order():
+    for state in Graph.State:
+        expected = connection_graph(state)
+        expected_list2 = [list(row) for row in expected.list2]
+        for query in [Graph.directed_edges, Graph.edges_number, Graph.degree_sequence, Graph.fingerprint]:
+            graph = connection_graph(state)
+            query(graph)
+            assert [list(row) for row in graph.list2] == expected_list2
+            assert graph.edges_number() == expected.edges_number()
+            assert graph.directed_edges() == expected.directed_edges()
+
+
+def test_binary_graph_can_be_saved_over_its_own_file(tmp_path):
+    filename = str(tmp_path / 'graph.bin')
+    for state in Graph.State:
+        graph = connection_graph(state)
+        write_binary_graph(filename, graph)
+        opened = open_binary_graph(filename)
+        write_binary_graph(filename, opened)
+        assert opened.directed_edges() == graph.directed_edges()
+        opened.close()
+        assert open_binary_graph(filename).directed_edges() == graph.directed_edges()
+
+
+def test_edgeless_incidence_graph_keeps_its_vertices(tmp_path):
+    filename = str(tmp_path / 'graph.txt')
+    for state in [Graph.State.INCIDENCE_MATRIX, Graph.State.SPARSE_INCIDENCE]:
+        graph = Graph([[0, 0, 0]] * 3, Graph.State.ADJACENCY_MATRIX)
+        graph.set_state(state)
+        write_list2(filename, graph.list2)
+        assert len(read_graph(filename, state).vertices()) == 3
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+@pytest.mark.parametrize('text, message', [
+    ('1 0 1\n0 1\n1 0 0 1\n', 'row 2 has 2 numbers, expected 3'),
+    ('1 0\n0 x\n', 'row 2:'),
+    ('1 0\n0 200\n', 'row 2:'),
+])
+def test_malformed_matrix_rows_are_reported(tmp_path, use_numpy, text, message):
+    if use_numpy and not numpy_backend.enable():
+        pytest.skip('NumPy is not installed')
+    filename = tmp_path / 'graph.txt'
+    filename.write_text(text)
+    try:
+        with pytest.raises(ValueError, match=message):
+            read_graph(str(filename), Graph.State.INCIDENCE_MATRIX)
+    finally:
+        numpy_backend.disable()
+
+
+def mixed_graph(state: Graph.State) -> Graph:
+    graph = Graph([[2, 1, 0, 0], [1, 0, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]], Graph.State.ADJACENCY_MATRIX, 'mixed')
+    graph.set_state(state)
+    return graph
+
+
+def test_state_conversions_keep_edge_semantics():
+    expected_edges = [(0, 0), (0, 0), (0, 1), (1, 0), (1, 2)]
+    for old_state in Graph.State:
+        for new_state in Graph.State:
+            graph = mixed_graph(old_state)
+            graph.set_state(new_state)
+            assert graph.directed_edges() == expected_edges
+            assert len(graph.vertices()) == 4 and graph.edges_number() == 3
+        graph = mixed_graph(old_state)
+        graph.set_state(Graph.State.INCIDENCE_MATRIX)
+        columns = sorted(tuple(row[k] for row in graph.list2) for k in range(len(graph.list2[0])))
+        assert columns == [(0, 1, -1, 0), (1, 1, 0, 0), (2, 0, 0, 0)]
+
+
+def test_intersection_and_symmetric_difference_follow_multiset_rules():
+    other = Graph([[1, 1], [0, 0]], Graph.State.ADJACENCY_MATRIX)
+    for state in Graph.State:
+        intersection = mixed_graph(state).intersection(other)
+        assert intersection.edges_number() == 2
+        intersection = intersection.materialize()
+        assert len(intersection.vertices()) == 2
+        assert intersection.directed_edges() == [(0, 0), (0, 1)]
+        symmetric_difference = mixed_graph(state).symmetric_difference(other)
+        assert symmetric_difference.edges_number() == 3
+        symmetric_difference = symmetric_difference.materialize()
+        assert len(symmetric_difference.vertices()) == 4
+        assert symmetric_difference.directed_edges() == [(0, 0), (1, 0), (1, 2)]
+
+
+def test_expression_nodes_count_edges_without_materializing():
+    for state in Graph.State:
+        contraction = mixed_graph(state).contraction(0, 2)
+        assert contraction.edges_number() == contraction.materialize().edges_number() == 1
+        union = mixed_graph(state).union(mixed_graph(Graph.State.ADJACENCY_LIST))
+        assert union.edges_number() == 6
+        assert union.materialize().directed_edges() == [(0, 0), (0, 0), (0, 1), (1, 0), (1, 2),
+                                                        (4, 4), (4, 4), (4, 5), (5, 4), (5, 6)]
+
+
+@pytest.mark.parametrize('extension', ['.edges', '.edges.gz'])
+def test_edge_list_round_trip(tmp_path, extension):
+    filename = str(tmp_path / f'graph{extension}')
+    for old_state in Graph.State:
+        write_edge_list(filename, mixed_graph(old_state))
+        for new_state in Graph.State:
+            graph = read_edge_list(filename, new_state)
+            assert graph.state == new_state and len(graph.vertices()) == 4
+            assert graph.directed_edges() == [(0, 0), (0, 0), (0, 1), (1, 0), (1, 2)]
+
+
+def test_bulk_mutators_accept_generators():
+    graph = Graph([[0, 1, 0], [0, 0, 1], [1, 0, 0]], Graph.State.ADJACENCY_MATRIX)
+    graph.remove_vertices(v for v in [0])
+    assert len(graph.vertices()) == 2
+    graph.add_directed_edges(e for e in [(0, 0), (1, 0)])
+    assert graph.directed_edges() == [(0, 0), (0, 1), (1, 0)]
+
+
+def test_redo_replays_bulk_edits_given_as_generators():
+    graph = Graph([[0, 0], [0, 0]], Graph.State.ADJACENCY_MATRIX)
+    graph.start_journal()
+    graph.add_directed_edges(e for e in [(0, 0), (1, 0)])
+    assert graph.undo() and graph.directed_edges() == []
+    assert graph.redo() and graph.directed_edges() == [(0, 0), (1, 0)]
+    graph.remove_vertices(v for v in [1])
+    assert graph.undo() and graph.redo() and len(graph.vertices()) == 1
+
+
+def test_session_store_defers_weisfeiler_lehman_fingerprints(tmp_path):
+    graphs = SessionStore(str(tmp_path / 'graphs.bin'))
+    graph = Graph([[0, 1, 0], [0, 0, 1], [0, 0, 0]], Graph.State.ADJACENCY_MATRIX, 'path')
+    graphs.append(graph)
+    graph.add_directed_edge((2, 0))
+    graphs.sync(0)
+    assert graphs.fingerprints[SessionStore.Record.FINGERPRINT] == {}
+    cycle = Graph([[0, 0, 1], [1, 0, 0], [0, 1, 0]], Graph.State.ADJACENCY_MATRIX)
+    assert graphs.similar(cycle) == [0]
+    assert graphs.find(Graph([[0, 1, 0], [0, 0, 1], [1, 0, 0]], Graph.State.ADJACENCY_MATRIX)) == 0
+    assert graphs.find(Graph([[0, 1, 1], [0, 0, 0], [0, 0, 0]], Graph.State.ADJACENCY_MATRIX)) is None
+    graphs.close()
+    graphs = SessionStore(str(tmp_path / 'graphs.bin'))
+    assert graphs.similar(cycle) == [0] and len(graphs.graphs) == 0
+    graphs.close()
+
+
+def test_batch_rejects_inputs_with_the_same_output_name(tmp_path):
+    for directory, text in [('a', '0 1\n1 0\n'), ('b', '0 1\n0 0\n'), ('c', '0 0\n0 0\n')]:
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / f'{"h" if directory == "c" else "g"}.txt').write_text(text)
+    filenames = [str(tmp_path / 'a' / 'g.txt'), str(tmp_path / 'b' / 'g.txt'), str(tmp_path / 'c' / 'h.txt')]
+    output = io.StringIO()
+    failures_number = batch.run(filenames, Graph.State.ADJACENCY_MATRIX, False, [], str(tmp_path / 'out'), 'text', 1,
+                                output)
+    assert failures_number == 2
+    assert sorted(path.name for path in (tmp_path / 'out').iterdir()) == ['h.txt']